@@ -1,5 +1,7 @@
 """AWS adapter implementing CloudProvider interface."""
 
+import json
+
 from botocore.exceptions import ClientError
 
 from guard.clients.aws_client import AWSClient
@@ -27,6 +29,7 @@ class AWSAdapter(CloudProvider):
         """
         self.client = AWSClient(region=region, profile=profile)
         self._secrets_client = self.client.session.client("secretsmanager")
+        self._secrets: dict[str, dict[str, str]] = {}
         logger.debug("aws_adapter_initialized", region=region)
 
     async def assume_role(self, role_arn: str, session_name: str) -> CloudCredentials:
@@ -72,6 +75,9 @@ class AWSAdapter(CloudProvider):
     async def get_secret(self, secret_name: str) -> dict[str, str]:
         """Retrieve a secret from secrets manager.
 
+        Parsed secrets are cached per adapter, so repeated lookups of the same
+        secret do not call Secrets Manager again.
+
         Args:
             secret_name: Name/ARN of the secret
 
@@ -81,18 +87,21 @@ class AWSAdapter(CloudProvider):
         Raises:
             CloudProviderError: If secret retrieval fails
         """
+        if secret_name in self._secrets:
+            logger.debug("secret_cached", secret_name=secret_name)
+            return dict(self._secrets[secret_name])
+
         try:
             logger.debug("getting_secret", secret_name=secret_name)
 
             response = self._secrets_client.get_secret_value(SecretId=secret_name)
 
             # Parse secret string (assuming JSON format)
-            import json
-
             secret_dict = json.loads(response["SecretString"])
+            self._secrets[secret_name] = secret_dict
 
             logger.info("secret_retrieved", secret_name=secret_name)
-            return secret_dict
+            return dict(secret_dict)
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -4,7 +4,7 @@ import asyncio
 
 from guard.checks.check_registry import CheckRegistry
 from guard.core.models import CheckResult, ClusterConfig
-from guard.interfaces.check import CheckContext
+from guard.interfaces.check import Check, CheckContext
 from guard.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,7 +32,7 @@ class CheckOrchestrator:
         Args:
             registry: Check registry containing registered checks
             fail_fast: Stop on first check failure (default: True)
-            max_concurrent: Maximum concurrent check executions
+            max_concurrent: Maximum concurrent check executions in run_checks
         """
         self.registry = registry
         self.fail_fast = fail_fast
@@ -43,99 +43,158 @@ class CheckOrchestrator:
             max_concurrent=max_concurrent,
         )
 
-    async def run_checks(
-        self,
+    @staticmethod
+    async def _execute_with_timeout(
+        check: Check,
         cluster: ClusterConfig,
         context: CheckContext,
-    ) -> list[CheckResult]:
-        """Run all registered checks for a cluster.
+    ) -> CheckResult:
+        """Execute a check, raising TimeoutError if it exceeds its timeout.
+
+        asyncio.timeout() cancels the check in place rather than wrapping it
+        in an extra task the way asyncio.wait_for() does.
 
         Args:
+            check: Check to execute
             cluster: Cluster configuration
             context: Check context with provider dependencies
 
         Returns:
-            List of check results
+            Check result
+        """
+        async with asyncio.timeout(check.timeout_seconds):
+            return await check.execute(cluster, context)
+
+    @staticmethod
+    async def _cancel_and_wait(tasks: list[asyncio.Task[CheckResult]]) -> None:
+        """Cancel any unfinished tasks and wait for them to unwind.
 
-        Raises:
-            Exception: If check execution fails critically
+        Args:
+            tasks: Check tasks, some of which may already be done
         """
-        logger.info("running_checks", cluster_id=cluster.cluster_id)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-        checks = self.registry.get_checks_for_cluster(cluster)
-        results = []
+    async def _run_single(
+        self,
+        check: Check,
+        cluster: ClusterConfig,
+        context: CheckContext,
+    ) -> CheckResult:
+        """Run one check, turning timeouts and errors into failed results.
 
-        for check in checks:
-            logger.debug("executing_check", check_name=check.name)
+        Args:
+            check: Check to execute
+            cluster: Cluster configuration
+            context: Check context with provider dependencies
 
-            try:
-                # Execute check with timeout
-                result = await asyncio.wait_for(
-                    check.execute(cluster, context),
-                    timeout=check.timeout_seconds,
-                )
-                results.append(result)
+        Returns:
+            Check result
+        """
+        logger.debug("executing_check", check_name=check.name)
+
+        try:
+            result = await self._execute_with_timeout(check, cluster, context)
+
+        except TimeoutError:
+            logger.error(
+                "check_timeout",
+                check_name=check.name,
+                timeout=check.timeout_seconds,
+            )
+
+            # Create failure result for timeout
+            return CheckResult(
+                check_name=check.name,
+                passed=False,
+                message=f"Check timed out after {check.timeout_seconds} seconds",
+                metrics={},
+            )
+
+        except Exception as e:
+            logger.error(
+                "check_execution_failed",
+                check_name=check.name,
+                error=str(e),
+            )
+
+            # Create failure result for exception
+            return CheckResult(
+                check_name=check.name,
+                passed=False,
+                message=f"Check failed with error: {e}",
+                metrics={},
+            )
 
-                logger.info(
-                    "check_completed",
-                    check_name=check.name,
-                    passed=result.passed,
-                )
+        logger.info(
+            "check_completed",
+            check_name=check.name,
+            passed=result.passed,
+        )
+        return result
 
-                # Fail fast if enabled and check failed
-                if self.fail_fast and not result.passed and check.is_critical:
-                    logger.warning(
-                        "check_failed_stopping",
-                        check_name=check.name,
-                        message=result.message,
-                    )
-                    break
+    async def run_checks(
+        self,
+        cluster: ClusterConfig,
+        context: CheckContext,
+    ) -> list[CheckResult]:
+        """Run all registered checks for a cluster.
 
-            except TimeoutError:
-                logger.error(
-                    "check_timeout",
-                    check_name=check.name,
-                    timeout=check.timeout_seconds,
-                )
+        Checks run in batches of up to max_concurrent at a time, in
+        registration order. With fail_fast, a critical failure cancels the
+        checks still running in its batch, drops the results of checks after
+        it, and stops any later batch from starting.
 
-                # Create failure result for timeout
-                result = CheckResult(
-                    check_name=check.name,
-                    passed=False,
-                    message=f"Check timed out after {check.timeout_seconds} seconds",
-                    metrics={},
-                )
-                results.append(result)
+        Args:
+            cluster: Cluster configuration
+            context: Check context with provider dependencies
 
-                if self.fail_fast and check.is_critical:
-                    break
+        Returns:
+            List of check results
+        """
+        logger.info("running_checks", cluster_id=cluster.cluster_id)
 
-            except Exception as e:
-                logger.error(
-                    "check_execution_failed",
-                    check_name=check.name,
-                    error=str(e),
-                )
+        checks = self.registry.get_checks_for_cluster(cluster)
+        results: list[CheckResult] = []
+        passed = 0
 
-                # Create failure result for exception
-                result = CheckResult(
-                    check_name=check.name,
-                    passed=False,
-                    message=f"Check failed with error: {e}",
-                    metrics={},
-                )
-                results.append(result)
+        for start in range(0, len(checks), self.max_concurrent):
+            batch = checks[start : start + self.max_concurrent]
+            tasks = [
+                asyncio.create_task(self._run_single(check, cluster, context)) for check in batch
+            ]
 
-                if self.fail_fast and check.is_critical:
-                    break
+            stop = False
+            try:
+                for check, task in zip(batch, tasks, strict=True):
+                    result = await task
+                    results.append(result)
+                    if result.passed:
+                        passed += 1
+
+                    # Fail fast if enabled and check failed
+                    if self.fail_fast and not result.passed and check.is_critical:
+                        logger.warning(
+                            "check_failed_stopping",
+                            check_name=check.name,
+                            message=result.message,
+                        )
+                        stop = True
+                        break
+            finally:
+                # Don't wait out checks whose results will be discarded
+                await self._cancel_and_wait(tasks)
+
+            if stop:
+                break
 
-        all_passed = all(r.passed for r in results)
         logger.info(
             "checks_completed",
             cluster_id=cluster.cluster_id,
             total=len(results),
-            passed=sum(1 for r in results if r.passed),
-            all_passed=all_passed,
+            passed=passed,
+            all_passed=passed == len(results),
         )
 
         return results
@@ -163,6 +222,8 @@ class CheckOrchestrator:
         )
 
         results = []
+        # One dict lookup per requested name keeps this O(len(check_names)),
+        # independent of registry size, and runs checks in the requested order
         for check_name in check_names:
             check = self.registry.get_check(check_name)
             if not check:
@@ -170,10 +231,7 @@ class CheckOrchestrator:
                 continue
 
             try:
-                result = await asyncio.wait_for(
-                    check.execute(cluster, context),
-                    timeout=check.timeout_seconds,
-                )
+                result = await self._execute_with_timeout(check, cluster, context)
                 results.append(result)
 
             except Exception as e:
@@ -209,10 +267,7 @@ class CheckOrchestrator:
 
         for check in critical_checks:
             try:
-                result = await asyncio.wait_for(
-                    check.execute(cluster, context),
-                    timeout=check.timeout_seconds,
-                )
+                result = await self._execute_with_timeout(check, cluster, context)
                 results.append(result)
 
                 if self.fail_fast and not result.passed:
@@ -1,5 +1,6 @@
 """Registry for managing health checks."""
 
+from collections.abc import Iterable
 
 from guard.core.models import ClusterConfig
 from guard.interfaces.check import Check
@@ -17,8 +18,10 @@ class CheckRegistry:
 
     def __init__(self) -> None:
         """Initialize check registry."""
-        self._checks: list[Check] = []
+        # Insertion-ordered, so it also records execution order
         self._checks_by_name: dict[str, Check] = {}
+        # Critical subset, kept alongside so lookups skip the is_critical scan
+        self._critical_checks: dict[str, Check] = {}
         logger.debug("check_registry_initialized")
 
     def register(self, check: Check) -> None:
@@ -31,11 +34,35 @@ class CheckRegistry:
             logger.warning("check_already_registered", check_name=check.name)
             return
 
-        self._checks.append(check)
         self._checks_by_name[check.name] = check
+        if check.is_critical:
+            self._critical_checks[check.name] = check
 
         logger.debug("check_registered", check_name=check.name)
 
+    def register_many(self, checks: Iterable[Check]) -> None:
+        """Register several health checks in one update.
+
+        As with register(), a check whose name is already registered is
+        skipped, including repeats within the batch itself.
+
+        Args:
+            checks: Health checks to register, in execution order
+        """
+        new_checks: dict[str, Check] = {}
+        for check in checks:
+            if check.name in self._checks_by_name or check.name in new_checks:
+                logger.warning("check_already_registered", check_name=check.name)
+                continue
+            new_checks[check.name] = check
+
+        self._checks_by_name.update(new_checks)
+        self._critical_checks.update(
+            (name, check) for name, check in new_checks.items() if check.is_critical
+        )
+
+        logger.debug("checks_registered", check_names=list(new_checks))
+
     def unregister(self, check_name: str) -> bool:
         """Unregister a health check.
 
@@ -45,13 +72,10 @@ class CheckRegistry:
         Returns:
             True if check was found and removed
         """
-        if check_name not in self._checks_by_name:
+        if self._checks_by_name.pop(check_name, None) is None:
             logger.warning("check_not_found_for_unregister", check_name=check_name)
             return False
-
-        check = self._checks_by_name[check_name]
-        self._checks.remove(check)
-        del self._checks_by_name[check_name]
+        self._critical_checks.pop(check_name, None)
 
         logger.debug("check_unregistered", check_name=check_name)
         return True
@@ -73,7 +97,7 @@ class CheckRegistry:
         Returns:
             List of all registered checks
         """
-        return self._checks.copy()
+        return list(self._checks_by_name.values())
 
     def get_checks_for_cluster(self, _cluster: ClusterConfig) -> list[Check]:
         """Get checks applicable for a specific cluster.
@@ -96,14 +120,14 @@ class CheckRegistry:
         Returns:
             List of critical checks
         """
-        return [check for check in self._checks if check.is_critical]
+        return list(self._critical_checks.values())
 
     def clear(self) -> None:
         """Clear all registered checks."""
-        self._checks.clear()
         self._checks_by_name.clear()
+        self._critical_checks.clear()
         logger.debug("check_registry_cleared")
 
     def __len__(self) -> int:
         """Get number of registered checks."""
-        return len(self._checks)
+        return len(self._checks_by_name)
@@ -25,6 +25,8 @@ class GitLabClient:
         """
         self.url = url
         self.gl = gitlab.Gitlab(url, private_token=token)
+        # Username -> user ID; IDs never change, so successful lookups are reused
+        self._user_ids: dict[str, int] = {}
 
         try:
             self.gl.auth()
@@ -57,6 +59,21 @@ class GitLabClient:
             logger.error("get_project_failed", project_id=project_id, error=str(e))
             raise GitOpsError(f"Failed to get project {project_id}: {e}") from e
 
+    def _project_handle(self, project_id: str | int) -> Any:
+        """Get a lazy project handle without fetching the project.
+
+        The handle only carries the (URL-encoded) ID, which is all the branch,
+        file and MR managers need, so the /projects/:id round-trip is skipped.
+        A missing project surfaces as an error from the follow-up call.
+
+        Args:
+            project_id: Project ID or path (e.g., "group/project")
+
+        Returns:
+            Lazy project object
+        """
+        return self.gl.projects.get(project_id, lazy=True)
+
     @rate_limited("gitlab_api")
     @retry_on_exception(exceptions=(GitlabError,), max_attempts=3)
     def create_branch(self, project_id: str | int, branch_name: str, ref: str = "main") -> Any:
@@ -81,7 +98,7 @@ class GitLabClient:
                 ref=ref,
             )
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
             branch = project.branches.create({"branch": branch_name, "ref": ref})
 
             logger.info("branch_created", branch_name=branch_name)
@@ -119,7 +136,7 @@ class GitLabClient:
                 ref=ref,
             )
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
             file = project.files.get(file_path=file_path, ref=ref)
 
             # Decode file content
@@ -169,7 +186,7 @@ class GitLabClient:
                 branch=branch,
             )
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
 
             # Try to get existing file
             try:
@@ -229,7 +246,7 @@ class GitLabClient:
                 source_branch=source_branch,
             )
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
 
             filters = {"state": state}
             if source_branch:
@@ -360,7 +377,7 @@ class GitLabClient:
                     )
                     return existing_mr
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
 
             mr_data: dict[str, Any] = {
                 "source_branch": source_branch,
@@ -408,7 +425,7 @@ class GitLabClient:
         try:
             logger.debug("getting_merge_request", project_id=project_id, mr_iid=mr_iid)
 
-            project = self.get_project(project_id)
+            project = self._project_handle(project_id)
             mr = project.mergerequests.get(mr_iid)
 
             logger.info("merge_request_retrieved", mr_iid=mr_iid)
@@ -455,31 +472,53 @@ class GitLabClient:
             )
             raise GitOpsError(f"Failed to add comment to MR {mr_iid}: {e}") from e
 
-    @rate_limited("gitlab_api")
-    @retry_on_exception(exceptions=(GitlabError,), max_attempts=3)
     def get_user_id_by_username(self, username: str) -> int | None:
         """Look up GitLab user ID by username.
 
+        Successful lookups are cached for the lifetime of the client, so
+        repeated assignee resolution for the same owner costs one API call.
+
         Args:
             username: GitLab username (handle without @)
 
         Returns:
             User ID if found, None otherwise
         """
-        try:
-            # Remove @ prefix if present
-            clean_username = username.lstrip("@")
+        # Remove @ prefix if present
+        clean_username = username.lstrip("@")
 
-            logger.debug("looking_up_user", username=clean_username)
+        cached_id = self._user_ids.get(clean_username)
+        if cached_id is not None:
+            logger.debug("user_lookup_cached", username=clean_username, user_id=cached_id)
+            return cached_id
+
+        user_id = self._lookup_user_id(clean_username)
+        if user_id is not None:
+            self._user_ids[clean_username] = user_id
+        return user_id
+
+    @rate_limited("gitlab_api")
+    @retry_on_exception(exceptions=(GitlabError,), max_attempts=3)
+    def _lookup_user_id(self, username: str) -> int | None:
+        """Query GitLab for a user ID by username.
+
+        Args:
+            username: GitLab username without @ prefix
+
+        Returns:
+            User ID if found, None otherwise
+        """
+        try:
+            logger.debug("looking_up_user", username=username)
 
-            users = self.gl.users.list(username=clean_username)
+            users = self.gl.users.list(username=username)
             if users and len(users) > 0:
                 # Cast to Any to handle RESTObjectList | list[RESTObject] type
                 user_id: int = users[0].id  # type: ignore[index]
-                logger.info("user_found", username=clean_username, user_id=user_id)
+                logger.info("user_found", username=username, user_id=user_id)
                 return user_id
 
-            logger.warning("user_not_found", username=clean_username)
+            logger.warning("user_not_found", username=username)
             return None
 
         except GitlabError as e:
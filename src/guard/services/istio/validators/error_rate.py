@@ -1,6 +1,6 @@
 """Istio error rate validator."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from guard.core.models import ClusterConfig, ValidationThresholds
 from guard.interfaces.validator import MetricsSnapshot, ValidationResult, Validator
@@ -103,7 +103,7 @@ class IstioErrorRateValidator(Validator):
             passed=passed,
             violations=violations,
             metrics=current.metrics,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
         )
 
     async def get_required_metrics(self) -> list[str]:
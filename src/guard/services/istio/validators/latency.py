@@ -1,6 +1,6 @@
 """Istio latency validator."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from guard.core.models import ClusterConfig, ValidationThresholds
 from guard.interfaces.validator import MetricsSnapshot, ValidationResult, Validator
@@ -97,7 +97,7 @@ class IstioLatencyValidator(Validator):
             passed=passed,
             violations=violations,
             metrics=current.metrics,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
         )
 
     async def get_required_metrics(self) -> list[str]:
@@ -1,17 +1,22 @@
 """Validation orchestrator for post-upgrade validation."""
 
 import asyncio
-from datetime import datetime, timedelta
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 
 from guard.core.models import ClusterConfig, ValidationThresholds, get_metric_aggregation
 from guard.interfaces.metrics_provider import MetricsProvider
-from guard.interfaces.validator import MetricsSnapshot, ValidationResult
+from guard.interfaces.validator import MetricsSnapshot, ValidationResult, Validator
 from guard.utils.logging import get_logger
 from guard.validation.validator_registry import ValidatorRegistry
 
 logger = get_logger(__name__)
 
 
+class _CriticalValidatorFailedError(Exception):
+    """Raised inside the fail-fast task group to cancel remaining validators."""
+
+
 class ValidationOrchestrator:
     """Orchestrates post-upgrade validation.
 
@@ -28,6 +33,7 @@ class ValidationOrchestrator:
         registry: ValidatorRegistry,
         metrics_provider: MetricsProvider,
         fail_fast: bool = False,
+        max_concurrent_queries: int = 16,
     ):
         """Initialize validation orchestrator.
 
@@ -35,11 +41,20 @@ class ValidationOrchestrator:
             registry: Validator registry
             metrics_provider: Metrics provider for querying metrics
             fail_fast: Stop on first validation failure (default: False)
+            max_concurrent_queries: Maximum in-flight metric queries per capture,
+                keeps bursts within the metrics provider's rate limits
         """
         self.registry = registry
         self.metrics = metrics_provider
         self.fail_fast = fail_fast
-        logger.debug("validation_orchestrator_initialized", fail_fast=fail_fast)
+        self.max_concurrent_queries = max_concurrent_queries
+        # Required metrics are static per validator, so resolve them once
+        self._required_metrics_cache: dict[str, list[str]] = {}
+        logger.debug(
+            "validation_orchestrator_initialized",
+            fail_fast=fail_fast,
+            max_concurrent_queries=max_concurrent_queries,
+        )
 
     async def capture_baseline(
         self,
@@ -61,47 +76,22 @@ class ValidationOrchestrator:
             duration=duration_minutes,
         )
 
-        # Fix: Compute start_time from single end_time for consistency
-        end_time = datetime.utcnow()
+        # Fix: Compute start_time from single end_time for consistency. Use an
+        # aware datetime so .timestamp() is not skewed by the host's local zone.
+        end_time = datetime.now(UTC)
         start_time = end_time - timedelta(minutes=duration_minutes)
 
-        # Get all required metrics from validators
+        # Get all required metrics from validators, de-duplicated in first-seen
+        # order so queries are deterministic
         validators = self.registry.get_validators(cluster)
-        required_metrics = []
+        required_metrics: dict[str, None] = {}
         for validator in validators:
-            metrics = await validator.get_required_metrics()
-            required_metrics.extend(metrics)
-
-        # Remove duplicates
-        required_metrics = list(set(required_metrics))
+            required_metrics.update(dict.fromkeys(await self._get_required_metrics(validator)))
 
-        # Query each metric
-        metrics_data: dict[str, float | None] = {}
-        failed_metrics = []
         tags = cluster.datadog_tags.model_dump()
-
-        for metric_name in required_metrics:
-            try:
-                # Use per-metric aggregation instead of hardcoded "avg"
-                aggregation = get_metric_aggregation(metric_name)
-                value: float | None = await self.metrics.query_scalar(
-                    metric_name=metric_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    tags=tags,
-                    aggregation=aggregation,
-                )
-                metrics_data[metric_name] = value
-            except Exception as e:
-                logger.error(
-                    "metric_capture_failed",
-                    metric_name=metric_name,
-                    error=str(e),
-                )
-                # Fix: Store None instead of 0.0 to indicate missing data
-                # This prevents masking monitoring failures
-                metrics_data[metric_name] = None
-                failed_metrics.append(metric_name)
+        metrics_data, failed_metrics = await self._query_metrics(
+            required_metrics, start_time, end_time, tags
+        )
 
         # Warn if metrics are missing
         if failed_metrics:
@@ -150,35 +140,14 @@ class ValidationOrchestrator:
             duration=duration_minutes,
         )
 
-        end_time = datetime.utcnow()
+        end_time = datetime.now(UTC)
         start_time = end_time - timedelta(minutes=duration_minutes)
 
         # Query same metrics as baseline
-        metrics_data: dict[str, float | None] = {}
-        failed_metrics = []
         tags = cluster.datadog_tags.model_dump()
-
-        for metric_name in baseline.metrics:
-            try:
-                # Use per-metric aggregation instead of hardcoded "avg"
-                aggregation = get_metric_aggregation(metric_name)
-                value: float | None = await self.metrics.query_scalar(
-                    metric_name=metric_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    tags=tags,
-                    aggregation=aggregation,
-                )
-                metrics_data[metric_name] = value
-            except Exception as e:
-                logger.error(
-                    "metric_capture_failed",
-                    metric_name=metric_name,
-                    error=str(e),
-                )
-                # Fix: Store None instead of 0.0 to indicate missing data
-                metrics_data[metric_name] = None
-                failed_metrics.append(metric_name)
+        metrics_data, failed_metrics = await self._query_metrics(
+            baseline.metrics, start_time, end_time, tags
+        )
 
         # Warn if metrics are missing
         if failed_metrics:
@@ -226,83 +195,214 @@ class ValidationOrchestrator:
         logger.info("validating_upgrade", cluster_id=cluster.cluster_id)
 
         validators = self.registry.get_validators(cluster)
-        results = []
-
-        for validator in validators:
-            logger.debug("running_validator", validator_name=validator.name)
+        results: list[ValidationResult] = []
 
-            try:
-                result = await asyncio.wait_for(
-                    validator.validate(cluster, baseline, current, thresholds),
-                    timeout=validator.timeout_seconds,
+        # Validators are independent and I/O bound, so run them concurrently
+        if self.fail_fast:
+            results = await self._run_validators_fail_fast(
+                validators, cluster, baseline, current, thresholds
+            )
+        else:
+            results = list(
+                await asyncio.gather(
+                    *(
+                        self._run_validator(validator, cluster, baseline, current, thresholds)
+                        for validator in validators
+                    )
                 )
-                results.append(result)
+            )
 
-                logger.info(
-                    "validator_completed",
-                    validator_name=validator.name,
-                    passed=result.passed,
-                    violations=len(result.violations),
-                )
+        all_passed = all(r.passed for r in results)
+        logger.info(
+            "validation_completed",
+            cluster_id=cluster.cluster_id,
+            total=len(results),
+            passed=sum(1 for r in results if r.passed),
+            all_passed=all_passed,
+            # Per-validator outcomes, reported here instead of one line per validator
+            violations={r.validator_name: len(r.violations) for r in results},
+        )
 
-                # Fail fast if enabled
-                if self.fail_fast and not result.passed and validator.is_critical:
-                    logger.warning(
-                        "validator_failed_stopping",
-                        validator_name=validator.name,
-                    )
-                    break
+        return results
 
-            except TimeoutError:
-                logger.error(
-                    "validator_timeout",
-                    validator_name=validator.name,
-                    timeout=validator.timeout_seconds,
-                )
+    async def _run_validators_fail_fast(
+        self,
+        validators: list[Validator],
+        cluster: ClusterConfig,
+        baseline: MetricsSnapshot,
+        current: MetricsSnapshot,
+        thresholds: ValidationThresholds,
+    ) -> list[ValidationResult]:
+        """Run validators concurrently, cancelling the rest on a critical failure.
 
-                result = ValidationResult(
-                    cluster_id=cluster.cluster_id,
-                    validator_name=validator.name,
-                    passed=False,
-                    violations=[f"Validator timed out after {validator.timeout_seconds}s"],
-                    metrics={},
-                    timestamp=datetime.utcnow(),
-                )
-                results.append(result)
+        Args:
+            validators: Validators to run
+            cluster: Cluster configuration
+            baseline: Pre-upgrade metrics
+            current: Post-upgrade metrics
+            thresholds: Validation thresholds
+
+        Returns:
+            Results of the validators that completed, in registry order
+        """
+        completed: dict[int, ValidationResult] = {}
 
-                if self.fail_fast and validator.is_critical:
-                    break
+        async def run(index: int, validator: Validator) -> None:
+            result = await self._run_validator(validator, cluster, baseline, current, thresholds)
+            completed[index] = result
 
-            except Exception as e:
-                logger.error(
-                    "validator_execution_failed",
+            if not result.passed and validator.is_critical:
+                logger.warning(
+                    "validator_failed_stopping",
                     validator_name=validator.name,
-                    error=str(e),
                 )
+                # Raising inside the task group cancels all sibling validators
+                raise _CriticalValidatorFailedError(validator.name)
 
-                result = ValidationResult(
-                    cluster_id=cluster.cluster_id,
-                    validator_name=validator.name,
-                    passed=False,
-                    violations=[f"Validator failed: {e}"],
-                    metrics={},
-                    timestamp=datetime.utcnow(),
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for index, validator in enumerate(validators):
+                    tg.create_task(run(index, validator))
+        except* _CriticalValidatorFailedError:
+            pass
+
+        return [completed[index] for index in sorted(completed)]
+
+    async def _query_metrics(
+        self,
+        metric_names: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        tags: dict[str, str],
+    ) -> tuple[dict[str, float | None], list[str]]:
+        """Query metrics concurrently, bounded by max_concurrent_queries.
+
+        Args:
+            metric_names: Metric names to query
+            start_time: Start of the query window
+            end_time: End of the query window
+            tags: Tags to filter metrics by
+
+        Returns:
+            Tuple of (metric values keyed by name, names of metrics that failed)
+        """
+        # Created per call so the orchestrator is not tied to one event loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+
+        async def query(metric_name: str) -> float | None:
+            async with semaphore:
+                # Use per-metric aggregation instead of hardcoded "avg"
+                value: float | None = await self.metrics.query_scalar(
+                    metric_name=metric_name,
+                    start_time=start_time,
+                    end_time=end_time,
+                    tags=tags,
+                    aggregation=get_metric_aggregation(metric_name),
                 )
-                results.append(result)
+                return value
 
-                if self.fail_fast and validator.is_critical:
-                    break
+        names = list(metric_names)
+        values = await asyncio.gather(*(query(name) for name in names), return_exceptions=True)
 
-        all_passed = all(r.passed for r in results)
-        logger.info(
-            "validation_completed",
-            cluster_id=cluster.cluster_id,
-            total=len(results),
-            passed=sum(1 for r in results if r.passed),
-            all_passed=all_passed,
-        )
+        metrics_data: dict[str, float | None] = {}
+        failures: dict[str, str] = {}
+        for metric_name, value in zip(names, values, strict=True):
+            if isinstance(value, BaseException):
+                if not isinstance(value, Exception):
+                    raise value
+                # Fix: Store None instead of 0.0 to indicate missing data
+                # This prevents masking monitoring failures
+                metrics_data[metric_name] = None
+                failures[metric_name] = str(value)
+            else:
+                metrics_data[metric_name] = value
 
-        return results
+        # One log line for all failures rather than one per metric
+        if failures:
+            logger.error("metric_capture_failed", failures=failures)
+
+        return metrics_data, list(failures)
+
+    async def _get_required_metrics(self, validator: Validator) -> list[str]:
+        """Get a validator's required metrics, caching the result by name.
+
+        Args:
+            validator: Validator to query
+
+        Returns:
+            List of metric names
+        """
+        metrics = self._required_metrics_cache.get(validator.name)
+        if metrics is None:
+            metrics = await validator.get_required_metrics()
+            self._required_metrics_cache[validator.name] = metrics
+        return metrics
+
+    async def _run_validator(
+        self,
+        validator: Validator,
+        cluster: ClusterConfig,
+        baseline: MetricsSnapshot,
+        current: MetricsSnapshot,
+        thresholds: ValidationThresholds,
+    ) -> ValidationResult:
+        """Run a single validator with its timeout.
+
+        Timeouts and exceptions are converted into failed results so one
+        validator can never abort the others.
+
+        Args:
+            validator: Validator to run
+            cluster: Cluster configuration
+            baseline: Pre-upgrade metrics
+            current: Post-upgrade metrics
+            thresholds: Validation thresholds
+
+        Returns:
+            Validation result
+        """
+        logger.debug("running_validator", validator_name=validator.name)
+        started_at = datetime.now(UTC)
+
+        try:
+            result = await asyncio.wait_for(
+                validator.validate(cluster, baseline, current, thresholds),
+                timeout=validator.timeout_seconds,
+            )
+
+        except TimeoutError:
+            logger.error(
+                "validator_timeout",
+                validator_name=validator.name,
+                timeout=validator.timeout_seconds,
+            )
+
+            return ValidationResult(
+                cluster_id=cluster.cluster_id,
+                validator_name=validator.name,
+                passed=False,
+                violations=[f"Validator timed out after {validator.timeout_seconds}s"],
+                metrics={},
+                timestamp=started_at,
+            )
+
+        except Exception as e:
+            logger.error(
+                "validator_execution_failed",
+                validator_name=validator.name,
+                error=str(e),
+            )
+
+            return ValidationResult(
+                cluster_id=cluster.cluster_id,
+                validator_name=validator.name,
+                passed=False,
+                violations=[f"Validator failed: {e}"],
+                metrics={},
+                timestamp=started_at,
+            )
+
+        return result
 
     async def run_specific_validators(
         self,
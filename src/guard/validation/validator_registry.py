@@ -16,7 +16,6 @@ class ValidatorRegistry:
 
     def __init__(self) -> None:
         """Initialize validator registry."""
-        self._validators: list[Validator] = []
         self._validators_by_name: dict[str, Validator] = {}
         logger.debug("validator_registry_initialized")
 
@@ -30,7 +29,6 @@ class ValidatorRegistry:
             logger.warning("validator_already_registered", validator_name=validator.name)
             return
 
-        self._validators.append(validator)
         self._validators_by_name[validator.name] = validator
 
         logger.debug("validator_registered", validator_name=validator.name)
@@ -48,8 +46,6 @@ class ValidatorRegistry:
             logger.warning("validator_not_found_for_unregister", validator_name=validator_name)
             return False
 
-        validator = self._validators_by_name[validator_name]
-        self._validators.remove(validator)
         del self._validators_by_name[validator_name]
 
         logger.debug("validator_unregistered", validator_name=validator_name)
@@ -72,7 +68,7 @@ class ValidatorRegistry:
         Returns:
             List of all registered validators
         """
-        return self._validators.copy()
+        return list(self._validators_by_name.values())
 
     def get_validators(self, _cluster: ClusterConfig) -> list[Validator]:
         """Get validators applicable for a specific cluster.
@@ -95,14 +91,13 @@ class ValidatorRegistry:
         Returns:
             List of critical validators
         """
-        return [v for v in self._validators if v.is_critical]
+        return [v for v in self._validators_by_name.values() if v.is_critical]
 
     def clear(self) -> None:
         """Clear all registered validators."""
-        self._validators.clear()
         self._validators_by_name.clear()
         logger.debug("validator_registry_cleared")
 
     def __len__(self) -> int:
         """Get number of registered validators."""
-        return len(self._validators)
+        return len(self._validators_by_name)
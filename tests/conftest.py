@@ -1,24 +1,39 @@
 """Pytest configuration and shared fixtures."""
 
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from guard.clients.datadog_client import DatadogClient
+from guard.clients.gitlab_client import GitLabClient
+from guard.clients.istioctl import IstioctlWrapper
+from guard.clients.kubernetes_client import KubernetesClient
 from guard.core.models import ClusterConfig, DatadogTags
 
 
+@pytest.fixture(scope="session")
+def _rate_limiter_patcher() -> Iterator[Any]:
+    """Patch RateLimiter.acquire once for the whole session."""
+    # Mock the RateLimiter.acquire method to always succeed
+    patcher = patch("guard.utils.rate_limiter.RateLimiter.acquire", return_value=True)
+    patcher.start()
+    yield patcher
+    patcher.stop()
+
+
 @pytest.fixture(autouse=True)
-def mock_rate_limiters(request):
+def mock_rate_limiters(request, _rate_limiter_patcher):
     """Mock rate limiter for all tests to avoid registration issues."""
-    # Skip mocking for tests marked with no_rate_limiter_mock
+    # Lift the session-wide patch for tests marked with no_rate_limiter_mock
     if "no_rate_limiter_mock" in request.keywords:
+        _rate_limiter_patcher.stop()
         yield
+        _rate_limiter_patcher.start()
         return
 
-    # Mock the RateLimiter.acquire method to always succeed
-    with patch("guard.utils.rate_limiter.RateLimiter.acquire", return_value=True):
-        yield
+    yield
 
 
 @pytest.fixture
@@ -63,7 +78,11 @@ def sample_prod_cluster_config() -> ClusterConfig:
 
 @pytest.fixture
 def mock_dynamodb_table() -> MagicMock:
-    """Mock DynamoDB table for testing."""
+    """Mock DynamoDB table for testing.
+
+    boto3 builds the Table resource class at runtime, so there is no static
+    class to spec against here.
+    """
     table = MagicMock()
     table.table_name = "guard-cluster-registry"
     return table
@@ -72,35 +91,38 @@ def mock_dynamodb_table() -> MagicMock:
 @pytest.fixture
 def mock_aws_session() -> MagicMock:
     """Mock AWS session for testing."""
-    session = MagicMock()
+    # Imported here so runs that never touch AWS do not pay for loading boto3
+    import boto3
+
+    session = MagicMock(spec=boto3.Session)
     return session
 
 
 @pytest.fixture
 def mock_kubernetes_client() -> MagicMock:
     """Mock Kubernetes client for testing."""
-    client = MagicMock()
+    client = MagicMock(spec=KubernetesClient)
     return client
 
 
 @pytest.fixture
 def mock_datadog_client() -> MagicMock:
     """Mock Datadog client for testing."""
-    client = MagicMock()
+    client = MagicMock(spec=DatadogClient)
     return client
 
 
 @pytest.fixture
 def mock_gitlab_client() -> MagicMock:
     """Mock GitLab client for testing."""
-    client = MagicMock()
+    client = MagicMock(spec=GitLabClient)
     return client
 
 
 @pytest.fixture
 def mock_istioctl_wrapper() -> MagicMock:
     """Mock istioctl wrapper for testing."""
-    wrapper = MagicMock()
+    wrapper = MagicMock(spec=IstioctlWrapper)
     wrapper.analyze.return_value = (True, "No validation issues found")
     wrapper.version.return_value = {
         "clientVersion": {"version": "1.20.0"},
@@ -111,10 +133,12 @@ def mock_istioctl_wrapper() -> MagicMock:
 
 # ==============================================================================
 # Test Data Fixtures
+#
+# These are built once per session and shared, so treat them as read-only.
 # ==============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_datadog_metrics() -> dict[str, Any]:
     """Sample Datadog metrics response."""
     return {
@@ -128,37 +152,28 @@ def sample_datadog_metrics() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+def _ready_resource(name: str, namespace: str | None = None, **status: Any) -> dict[str, Any]:
+    """Build a Kubernetes resource dict with a Ready=True condition."""
+    metadata = {"name": name} if namespace is None else {"name": name, "namespace": namespace}
+    return {
+        "metadata": metadata,
+        "status": {**status, "conditions": [{"type": "Ready", "status": "True"}]},
+    }
+
+
+@pytest.fixture(scope="session")
 def sample_kubernetes_nodes() -> list[dict[str, Any]]:
     """Sample Kubernetes nodes response."""
-    return [
-        {
-            "metadata": {"name": "node-1"},
-            "status": {
-                "conditions": [{"type": "Ready", "status": "True"}],
-            },
-        },
-        {
-            "metadata": {"name": "node-2"},
-            "status": {
-                "conditions": [{"type": "Ready", "status": "True"}],
-            },
-        },
-    ]
+    return [_ready_resource("node-1"), _ready_resource("node-2")]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_istio_pods() -> list[dict[str, Any]]:
     """Sample Istio pods response."""
-    return [
-        {
-            "metadata": {"name": "istiod-1234567890-abcde", "namespace": "istio-system"},
-            "status": {"phase": "Running", "conditions": [{"type": "Ready", "status": "True"}]},
-        }
-    ]
+    return [_ready_resource("istiod-1234567890-abcde", namespace="istio-system", phase="Running")]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gitlab_project() -> dict[str, Any]:
     """Sample GitLab project response."""
     return {
@@ -169,7 +184,7 @@ def sample_gitlab_project() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_merge_request() -> dict[str, Any]:
     """Sample GitLab merge request response."""
     return {
@@ -181,16 +196,3 @@ def sample_merge_request() -> dict[str, Any]:
         "source_branch": "feature/istio-1.20.0-test",
         "target_branch": "main",
     }
-
-
-# ==============================================================================
-# Pytest Markers
-# ==============================================================================
-
-
-def pytest_configure(config: Any) -> None:
-    """Configure pytest markers."""
-    config.addinivalue_line("markers", "unit: Unit tests")
-    config.addinivalue_line("markers", "integration: Integration tests")
-    config.addinivalue_line("markers", "e2e: End-to-end tests")
-    config.addinivalue_line("markers", "no_rate_limiter_mock: Disable rate limiter mocking")
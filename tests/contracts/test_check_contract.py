@@ -1,95 +1,123 @@
 """Contract tests for Check interface.
 
 All Check implementations must pass these tests to ensure substitutability.
+Every concrete Check subclass in the shipped check packages is discovered and
+run through the same parametrized suite, so new checks are covered by adding
+them to one of those packages.
 """
 
+import inspect
+from unittest.mock import MagicMock
+
 import pytest
 
-from guard.core.models import CheckResult, ClusterConfig
+import guard.checks.kubernetes
+import guard.services.istio.checks
+from guard.clients.istioctl import IstioctlWrapper
+from guard.core.models import CheckResult, ClusterConfig, DatadogTags
 from guard.interfaces.check import Check, CheckContext
 
 
-class CheckContract:
-    """Base contract tests for Check interface."""
-
-    @pytest.fixture
-    def check(self) -> Check:
-        """Subclass must provide concrete Check implementation."""
-        raise NotImplementedError("Subclass must implement check fixture")
-
-    @pytest.fixture
-    def sample_cluster(self) -> ClusterConfig:
-        """Sample cluster configuration for testing."""
-        from guard.core.models import DatadogTags
-
-        return ClusterConfig(
-            cluster_id="test-cluster-1",
-            batch_id="test",
-            environment="test",
-            region="us-east-1",
-            gitlab_repo="test/repo",
-            flux_config_path="test/path.yaml",
-            aws_role_arn="arn:aws:iam::123:role/test",
-            current_istio_version="1.19.0",
-            datadog_tags=DatadogTags(cluster="test-cluster-1", env="test"),
-            owner_team="test-team",
-            owner_handle="test-user",
-        )
-
-    @pytest.fixture
-    def mock_context(self) -> CheckContext:
-        """Mock check context."""
-        return CheckContext(
-            cloud_provider=None,
-            kubernetes_provider=None,
-            metrics_provider=None,
-            extra_context={},
-        )
-
-    def test_check_has_name(self, check: Check):
-        """Check must have a name."""
-        assert hasattr(check, "name")
-        assert isinstance(check.name, str)
-        assert len(check.name) > 0
-
-    def test_check_has_description(self, check: Check):
-        """Check must have a description."""
-        assert hasattr(check, "description")
-        assert isinstance(check.description, str)
-        assert len(check.description) > 0
-
-    def test_check_has_is_critical(self, check: Check):
-        """Check must have is_critical property."""
-        assert hasattr(check, "is_critical")
-        assert isinstance(check.is_critical, bool)
-
-    def test_check_has_timeout_seconds(self, check: Check):
-        """Check must have timeout_seconds property."""
-        assert hasattr(check, "timeout_seconds")
-        assert isinstance(check.timeout_seconds, int)
-        assert check.timeout_seconds > 0
-
-    @pytest.mark.asyncio
-    async def test_execute_returns_check_result(
-        self,
-        check: Check,
-        sample_cluster: ClusterConfig,
-        mock_context: CheckContext,
-    ):
-        """Execute must return CheckResult."""
-        result = await check.execute(sample_cluster, mock_context)
-
-        assert isinstance(result, CheckResult)
-        assert hasattr(result, "check_name")
-        assert hasattr(result, "passed")
-        assert hasattr(result, "message")
-        assert isinstance(result.passed, bool)
-        assert isinstance(result.message, str)
-
-
-# Example usage:
-# class TestControlPlaneHealthCheck(CheckContract):
-#     @pytest.fixture
-#     def check(self):
-#         from guard.checks.kubernetes.control_plane import ControlPlaneHealthCheck
-#         return ControlPlaneHealthCheck()
+# Importing the check packages registers their Check subclasses; only classes
+# defined in these packages are collected, never test doubles from elsewhere
+_CHECK_PACKAGES = (guard.checks.kubernetes.__name__, guard.services.istio.checks.__name__)
+
+
+def _concrete_checks(base: type[Check] = Check) -> list[type[Check]]:
+    """Collect all shipped non-abstract Check subclasses, sorted by class name.
+
+    Subclasses defined outside _CHECK_PACKAGES, such as test doubles in other
+    test modules, are skipped so the suite does not depend on what else was
+    collected.
+    """
+    found: list[type[Check]] = []
+    for subclass in base.__subclasses__():
+        if not inspect.isabstract(subclass) and subclass.__module__.startswith(_CHECK_PACKAGES):
+            found.append(subclass)
+        found.extend(_concrete_checks(subclass))
+    return sorted(found, key=lambda cls: cls.__name__)
+
+
+CHECK_TYPES = _concrete_checks()
+
+
+@pytest.fixture(params=CHECK_TYPES, ids=lambda cls: cls.__name__)
+def check(request: pytest.FixtureRequest) -> Check:
+    """Concrete Check implementation under test."""
+    check_type: type[Check] = request.param
+    return check_type()
+
+
+@pytest.fixture(scope="session")
+def sample_cluster() -> ClusterConfig:
+    """Sample cluster configuration for testing.
+
+    Shared across the suite; checks only read the cluster, never mutate it.
+    """
+    return ClusterConfig(
+        cluster_id="test-cluster-1",
+        batch_id="test",
+        environment="test",
+        region="us-east-1",
+        gitlab_repo="test/repo",
+        flux_config_path="test/path.yaml",
+        aws_role_arn="arn:aws:iam::123:role/test",
+        current_istio_version="1.19.0",
+        datadog_tags=DatadogTags(cluster="test-cluster-1", env="test"),
+        owner_team="test-team",
+        owner_handle="test-user",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_context() -> CheckContext:
+    """Mock check context.
+
+    The istioctl wrapper is injected so no check shells out during the suite.
+    """
+    istioctl = MagicMock(spec=IstioctlWrapper)
+    istioctl.analyze.return_value = (True, "No validation issues found")
+    return CheckContext(
+        cloud_provider=None,
+        kubernetes_provider=None,
+        metrics_provider=None,
+        extra_context={"istioctl": istioctl},
+    )
+
+
+def test_checks_discovered():
+    """At least one concrete Check implementation must be discovered."""
+    assert CHECK_TYPES
+
+
+def test_check_conforms_to_interface(check: Check):
+    """Check must implement the interface with correctly typed metadata."""
+    assert isinstance(check, Check)
+    assert isinstance(check.name, str)
+    assert isinstance(check.description, str)
+    assert isinstance(check.is_critical, bool)
+    assert isinstance(check.timeout_seconds, int)
+
+
+def test_check_metadata_nonempty(check: Check):
+    """Check name and description must be non-empty and the timeout positive."""
+    for attr in ("name", "description"):
+        assert len(getattr(check, attr)) > 0, f"{attr} is empty"
+    assert check.timeout_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_check_result(
+    check: Check,
+    sample_cluster: ClusterConfig,
+    mock_context: CheckContext,
+):
+    """Execute must return CheckResult."""
+    result = await check.execute(sample_cluster, mock_context)
+
+    assert isinstance(result, CheckResult)
+    assert hasattr(result, "check_name")
+    assert hasattr(result, "passed")
+    assert hasattr(result, "message")
+    assert isinstance(result.passed, bool)
+    assert isinstance(result.message, str)
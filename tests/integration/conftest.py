@@ -1,23 +1,81 @@
-"""Integration test fixtures and configuration."""
+"""Integration test fixtures and configuration.
+
+The cloud SDKs and clients are imported inside the fixtures that need them so
+runs that skip integration tests never pay for loading them.
+"""
+
+from __future__ import annotations
 
 import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import boto3
 import pytest
-from botocore.exceptions import ClientError, NoCredentialsError
 
 from guard.core.models import ClusterConfig, DatadogTags
 
+if TYPE_CHECKING:
+    from guard.clients.aws_client import AWSClient
+    from guard.clients.datadog_client import DatadogClient
+    from guard.clients.gitlab_client import GitLabClient
+    from guard.clients.kubernetes_client import KubernetesClient
+
+
+@dataclass(frozen=True)
+class _IntegrationEnv:
+    """Integration test settings read from the environment."""
+
+    aws_region: str
+    aws_role_arn: str | None
+    gitlab_url: str
+    gitlab_token: str | None
+    gitlab_project_id: str | None
+    datadog_api_key: str | None
+    datadog_app_key: str | None
+    kubeconfig_path: str
+    k8s_context: str | None
+    cluster_id: str
+    cluster_region: str
+    cluster_role_arn: str
 
-@pytest.fixture
+
+# Snapshot the environment once at import so every fixture sees the same values
+_ENV = _IntegrationEnv(
+    aws_region=os.getenv("AWS_TEST_REGION", "us-east-1"),
+    aws_role_arn=os.getenv("AWS_TEST_ROLE_ARN"),
+    gitlab_url=os.getenv("GITLAB_TEST_URL", "https://gitlab.com"),
+    gitlab_token=os.getenv("GITLAB_TEST_TOKEN"),
+    gitlab_project_id=os.getenv("GITLAB_TEST_PROJECT_ID"),
+    datadog_api_key=os.getenv("DATADOG_TEST_API_KEY"),
+    datadog_app_key=os.getenv("DATADOG_TEST_APP_KEY"),
+    kubeconfig_path=os.getenv("KUBECONFIG", str(Path("~/.kube/config").expanduser())),
+    k8s_context=os.getenv("K8S_TEST_CONTEXT"),
+    cluster_id=os.getenv("GUARD_TEST_CLUSTER_ID", "eks-integration-test"),
+    cluster_region=os.getenv("GUARD_TEST_CLUSTER_REGION", "us-east-1"),
+    cluster_role_arn=os.getenv(
+        "GUARD_TEST_CLUSTER_ROLE_ARN", "arn:aws:iam::123456789:role/GUARD-Test"
+    ),
+)
+
+
+@pytest.fixture(scope="session")
 def aws_test_region() -> str:
     """AWS region for integration tests."""
-    return os.getenv("AWS_TEST_REGION", "us-east-1")
+    return _ENV.aws_region
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skip_if_no_aws_credentials():
-    """Skip test if AWS credentials are not available."""
+    """Skip test if AWS credentials are not available.
+
+    Session-scoped so the STS probe runs once per test run; pytest caches the
+    skip and re-raises it for every later test that requests this fixture.
+    """
+    import boto3
+    from botocore.exceptions import ClientError, NoCredentialsError
+
     try:
         sts = boto3.client("sts")
         sts.get_caller_identity()
@@ -25,38 +83,80 @@ def skip_if_no_aws_credentials():
         pytest.skip(f"AWS credentials not available: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def aws_client(aws_test_region: str, skip_if_no_aws_credentials) -> AWSClient:
+    """AWS client shared across the session so its boto3 connection pools are reused."""
+    from guard.clients.aws_client import AWSClient
+
+    return AWSClient(region=aws_test_region)
+
+
+@pytest.fixture(scope="session")
+def available_eks_clusters(aws_client: AWSClient) -> list[str]:
+    """EKS clusters in the test region, listed once per session."""
+    return aws_client.list_eks_clusters()
+
+
+@pytest.fixture(scope="session")
 def aws_test_role_arn() -> str | None:
     """Test AWS role ARN from environment (optional)."""
-    return os.getenv("AWS_TEST_ROLE_ARN")
+    return _ENV.aws_role_arn
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gitlab_test_token() -> str | None:
     """Test GitLab token from environment (optional)."""
-    return os.getenv("GITLAB_TEST_TOKEN")
+    return _ENV.gitlab_token
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datadog_test_api_key() -> str | None:
     """Test Datadog API key from environment (optional)."""
-    return os.getenv("DATADOG_TEST_API_KEY")
+    return _ENV.datadog_api_key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datadog_test_app_key() -> str | None:
     """Test Datadog App key from environment (optional)."""
-    return os.getenv("DATADOG_TEST_APP_KEY")
+    return _ENV.datadog_app_key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skip_if_no_gitlab_token(gitlab_test_token: str | None):
     """Skip test if GitLab token is not available."""
     if not gitlab_test_token:
         pytest.skip("GitLab token not available. Set GITLAB_TEST_TOKEN environment variable.")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def gitlab_client(gitlab_test_token: str | None, skip_if_no_gitlab_token) -> GitLabClient:
+    """GitLab client shared across the session so it authenticates only once."""
+    from guard.clients.gitlab_client import GitLabClient
+
+    return GitLabClient(url=_ENV.gitlab_url, token=gitlab_test_token)
+
+
+@pytest.fixture(scope="session")
+def gitlab_current_user(gitlab_client: GitLabClient) -> Any:
+    """User the GitLab client authenticated as, resolved once per session."""
+    return gitlab_client.gl.user
+
+
+@pytest.fixture(scope="session")
+def gitlab_test_project_id() -> str:
+    """GitLab test project ID from environment.
+
+    Set GITLAB_TEST_PROJECT_ID to a project you have access to for testing.
+    Example: "mygroup/myproject" or "12345"
+    """
+    if not _ENV.gitlab_project_id:
+        pytest.skip(
+            "GITLAB_TEST_PROJECT_ID not set. Set this to a project you have access to for testing."
+        )
+    return _ENV.gitlab_project_id
+
+
+@pytest.fixture(scope="session")
 def skip_if_no_datadog_credentials(
     datadog_test_api_key: str | None, datadog_test_app_key: str | None
 ):
@@ -68,7 +168,112 @@ def skip_if_no_datadog_credentials(
         )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def datadog_client(
+    datadog_test_api_key: str | None,
+    datadog_test_app_key: str | None,
+    skip_if_no_datadog_credentials,
+) -> DatadogClient:
+    """Datadog client shared across the session so its HTTP pool is reused."""
+    from guard.clients.datadog_client import DatadogClient
+
+    return DatadogClient(
+        api_key=datadog_test_api_key,
+        app_key=datadog_test_app_key,
+        site="datadoghq.com",
+    )
+
+
+@pytest.fixture(scope="session")
+def skip_if_no_kubeconfig():
+    """Skip test if kubeconfig is not available."""
+    if not Path(_ENV.kubeconfig_path).exists():
+        pytest.skip(
+            "Kubeconfig not found. Set KUBECONFIG environment variable or "
+            "ensure ~/.kube/config exists."
+        )
+
+
+@pytest.fixture(scope="session")
+def k8s_client(skip_if_no_kubeconfig) -> KubernetesClient:
+    """Kubernetes client shared across the session so kubeconfig is loaded once.
+
+    Set K8S_TEST_CONTEXT to use a specific kubeconfig context.
+    """
+    from kubernetes.config.config_exception import ConfigException
+
+    from guard.clients.kubernetes_client import KubernetesClient
+    from guard.core.exceptions import KubernetesError
+
+    try:
+        return KubernetesClient(context=_ENV.k8s_context)
+    except (ConfigException, KubernetesError) as e:
+        pytest.skip(f"Failed to initialize Kubernetes client: {e}")
+
+
+# Read-only listings, each issued at most once per session and only when a
+# test asks for it, so tests that only inspect listings share one LIST call.
+
+
+@pytest.fixture(scope="session")
+def cluster_nodes(k8s_client: KubernetesClient) -> list[Any]:
+    """Cluster nodes listed once per session."""
+    return k8s_client.get_nodes()
+
+
+@pytest.fixture(scope="session")
+def cluster_namespaces(k8s_client: KubernetesClient) -> list[Any]:
+    """Cluster namespaces listed once per session."""
+    return k8s_client.get_namespaces()
+
+
+@pytest.fixture(scope="session")
+def kube_system_pods(k8s_client: KubernetesClient) -> list[Any]:
+    """kube-system pods listed once per session."""
+    return k8s_client.get_pods(namespace="kube-system")
+
+
+@pytest.fixture(scope="session")
+def kube_system_deployments(k8s_client: KubernetesClient) -> list[Any]:
+    """kube-system deployments listed once per session."""
+    return k8s_client.get_deployments(namespace="kube-system")
+
+
+@pytest.fixture(scope="session")
+def kube_system_daemonsets(k8s_client: KubernetesClient) -> list[Any]:
+    """kube-system daemonsets listed once per session."""
+    return k8s_client.get_daemonsets(namespace="kube-system")
+
+
+@pytest.fixture(scope="session")
+def skip_if_no_istio(cluster_namespaces: list[Any]):
+    """Skip test if Istio is not installed in the cluster."""
+    namespace_names = [ns.metadata.name for ns in cluster_namespaces]
+    if "istio-system" not in namespace_names:
+        pytest.skip("Istio not installed in cluster (istio-system namespace not found)")
+
+
+@pytest.fixture(scope="session")
+def query_window() -> tuple[datetime, datetime]:
+    """One-hour metrics query window, frozen for the session.
+
+    Sharing one window keeps identical queries identical across tests so
+    Datadog can serve repeats from its cache.
+    """
+    end_time = datetime.now()
+    return end_time - timedelta(hours=1), end_time
+
+
+@pytest.fixture(scope="session")
+def all_monitors(datadog_client: DatadogClient) -> list[Any]:
+    """All monitors in the Datadog account, listed once per session."""
+    try:
+        return datadog_client.monitors_api.list_monitors()
+    except Exception as e:
+        pytest.skip(f"Could not list monitors: {e}")
+
+
+@pytest.fixture(scope="session")
 def integration_test_cluster_config() -> ClusterConfig:
     """Cluster configuration for integration testing.
 
@@ -76,22 +281,20 @@ def integration_test_cluster_config() -> ClusterConfig:
     - GUARD_TEST_CLUSTER_ID
     - GUARD_TEST_CLUSTER_REGION
     - GUARD_TEST_CLUSTER_ROLE_ARN
-    """
-    cluster_id = os.getenv("GUARD_TEST_CLUSTER_ID", "eks-integration-test")
-    region = os.getenv("GUARD_TEST_CLUSTER_REGION", "us-east-1")
-    role_arn = os.getenv("GUARD_TEST_CLUSTER_ROLE_ARN", "arn:aws:iam::123456789:role/GUARD-Test")
 
+    Built once per session from the env snapshot; treat it as read-only.
+    """
     return ClusterConfig(
-        cluster_id=cluster_id,
+        cluster_id=_ENV.cluster_id,
         batch_id="integration-test",
         environment="test",
-        region=region,
+        region=_ENV.cluster_region,
         gitlab_repo="infra/k8s-test-clusters",
         flux_config_path="clusters/test/istio-helmrelease.yaml",
-        aws_role_arn=role_arn,
+        aws_role_arn=_ENV.cluster_role_arn,
         current_istio_version="1.19.3",
         target_istio_version="1.20.0",
-        datadog_tags=DatadogTags(cluster=cluster_id, service="istio-system", env="test"),
+        datadog_tags=DatadogTags(cluster=_ENV.cluster_id, service="istio-system", env="test"),
         owner_team="platform-engineering",
         owner_handle="@platform-team",
     )
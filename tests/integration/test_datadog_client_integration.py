@@ -1,42 +1,32 @@
 """Integration tests for Datadog client."""
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any
 
 import pytest
 
 from guard.clients.datadog_client import DatadogClient
 from guard.core.exceptions import DatadogError
 
+pytestmark = [pytest.mark.integration, pytest.mark.parallel_safe]
+
 
-@pytest.mark.integration
 class TestDatadogClientIntegration:
     """Integration tests for DatadogClient with real Datadog API."""
 
-    @pytest.fixture
-    def datadog_client(
-        self,
-        datadog_test_api_key: str | None,
-        datadog_test_app_key: str | None,
-        skip_if_no_datadog_credentials,
-    ) -> DatadogClient:
-        """Create Datadog client for integration tests."""
-        return DatadogClient(
-            api_key=datadog_test_api_key,
-            app_key=datadog_test_app_key,
-            site="datadoghq.com",
-        )
-
     def test_client_initialization(self, datadog_client: DatadogClient):
         """Test Datadog client initializes successfully."""
         assert datadog_client.api_client is not None
         assert datadog_client.metrics_api is not None
         assert datadog_client.monitors_api is not None
 
-    def test_query_metrics_system_cpu(self, datadog_client: DatadogClient):
+    def test_query_metrics_system_cpu(
+        self, datadog_client: DatadogClient, query_window: tuple[datetime, datetime]
+    ):
         """Test querying system CPU metrics (available in most Datadog accounts)."""
         # Query last hour
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=1)
+        start_time, end_time = query_window
 
         # Query system.cpu.idle (common metric)
         query = "avg:system.cpu.idle{*}"
@@ -84,10 +74,11 @@ class TestDatadogClientIntegration:
             else:
                 raise
 
-    def test_query_metrics_invalid_query(self, datadog_client: DatadogClient):
+    def test_query_metrics_invalid_query(
+        self, datadog_client: DatadogClient, query_window: tuple[datetime, datetime]
+    ):
         """Test querying with invalid metric name."""
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=1)
+        start_time, end_time = query_window
 
         # Use an invalid metric name
         query = "avg:invalid.metric.that.does.not.exist.12345{*}"
@@ -107,25 +98,18 @@ class TestDatadogClientIntegration:
             # This is also acceptable for an invalid metric
             pass
 
-    def test_list_monitors(self, datadog_client: DatadogClient):
+    def test_list_monitors(self, all_monitors: list[Any]):
         """Test listing all monitors."""
-        try:
-            # Get all monitors (no filters)
-            monitors = datadog_client.monitors_api.list_monitors()
-
-            assert isinstance(monitors, list)
-            # Account may or may not have monitors
+        assert isinstance(all_monitors, list)
+        # Account may or may not have monitors
 
-            if len(monitors) > 0:
-                monitor = monitors[0]
-                # Verify monitor structure
-                assert hasattr(monitor, "id")
-                assert hasattr(monitor, "name")
-                assert hasattr(monitor, "type")
-                assert hasattr(monitor, "overall_state")
-
-        except Exception as e:
-            pytest.skip(f"Could not list monitors: {e}")
+        if len(all_monitors) > 0:
+            monitor = all_monitors[0]
+            # Verify monitor structure
+            assert hasattr(monitor, "id")
+            assert hasattr(monitor, "name")
+            assert hasattr(monitor, "type")
+            assert hasattr(monitor, "overall_state")
 
     def test_get_active_alerts(self, datadog_client: DatadogClient):
         """Test getting active alerts."""
@@ -154,7 +138,6 @@ class TestDatadogClientIntegration:
         assert len(active_alerts) >= 0
 
 
-@pytest.mark.integration
 @pytest.mark.slow
 class TestDatadogClientIstioIntegration:
     """Integration tests for Istio-specific Datadog metrics.
@@ -162,23 +145,11 @@ class TestDatadogClientIstioIntegration:
     These tests assume Istio metrics are being collected in Datadog.
     """
 
-    @pytest.fixture
-    def datadog_client(
-        self,
-        datadog_test_api_key: str | None,
-        datadog_test_app_key: str | None,
-        skip_if_no_datadog_credentials,
-    ) -> DatadogClient:
-        """Create Datadog client for integration tests."""
-        return DatadogClient(
-            api_key=datadog_test_api_key,
-            app_key=datadog_test_app_key,
-        )
-
-    def test_query_istio_metrics(self, datadog_client: DatadogClient):
+    def test_query_istio_metrics(
+        self, datadog_client: DatadogClient, query_window: tuple[datetime, datetime]
+    ):
         """Test querying Istio metrics (if available)."""
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=1)
+        start_time, end_time = query_window
 
         # Common Istio metrics
         istio_queries = [
@@ -187,30 +158,37 @@ class TestDatadogClientIstioIntegration:
             "avg:istio.pilot.services{*}",
         ]
 
+        # Probe all queries at once so a missing-Istio account costs one round-trip
         found_istio_metrics = False
-        for query in istio_queries:
-            try:
-                result = datadog_client.query_metrics(
+        with ThreadPoolExecutor(max_workers=len(istio_queries)) as executor:
+            futures = [
+                executor.submit(
+                    datadog_client.query_metrics,
                     query=query,
                     start=start_time,
                     end=end_time,
                 )
+                for query in istio_queries
+            ]
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except DatadogError:
+                    continue
 
                 if result.get("series") and len(result["series"]) > 0:
                     found_istio_metrics = True
                     assert result["status"] == "ok"
                     break
 
-            except DatadogError:
-                continue
-
         if not found_istio_metrics:
             pytest.skip("No Istio metrics found in Datadog account")
 
-    def test_query_istio_metrics_by_cluster(self, datadog_client: DatadogClient):
+    def test_query_istio_metrics_by_cluster(
+        self, datadog_client: DatadogClient, query_window: tuple[datetime, datetime]
+    ):
         """Test querying Istio metrics filtered by cluster tag."""
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=1)
+        start_time, end_time = query_window
 
         # Query with cluster filter (will fail if no matching data)
         query = "avg:istio.mesh.request.count{cluster:*} by {cluster}"
@@ -234,36 +212,19 @@ class TestDatadogClientIstioIntegration:
             pytest.skip(f"No Istio metrics available: {e}")
 
 
-@pytest.mark.integration
 class TestDatadogClientMonitorOperations:
     """Integration tests for monitor operations.
 
     These tests interact with monitors in the Datadog account.
     """
 
-    @pytest.fixture
-    def datadog_client(
-        self,
-        datadog_test_api_key: str | None,
-        datadog_test_app_key: str | None,
-        skip_if_no_datadog_credentials,
-    ) -> DatadogClient:
-        """Create Datadog client for integration tests."""
-        return DatadogClient(
-            api_key=datadog_test_api_key,
-            app_key=datadog_test_app_key,
-        )
-
-    def test_get_monitor_by_id(self, datadog_client: DatadogClient):
+    def test_get_monitor_by_id(self, datadog_client: DatadogClient, all_monitors: list[Any]):
         """Test getting a specific monitor by ID."""
-        # First, list monitors to get a valid ID
-        try:
-            monitors = datadog_client.monitors_api.list_monitors()
-
-            if not monitors:
-                pytest.skip("No monitors available in account for testing")
+        if not all_monitors:
+            pytest.skip("No monitors available in account for testing")
 
-            monitor_id = monitors[0].id
+        try:
+            monitor_id = all_monitors[0].id
 
             # Get the specific monitor
             monitor = datadog_client.get_monitor(monitor_id)
@@ -285,18 +246,15 @@ class TestDatadogClientMonitorOperations:
         with pytest.raises(DatadogError):
             datadog_client.get_monitor(invalid_id)
 
-    def test_check_monitors_by_tags(self, datadog_client: DatadogClient):
+    def test_check_monitors_by_tags(self, datadog_client: DatadogClient, all_monitors: list[Any]):
         """Test checking monitors filtered by tags."""
-        # List all monitors first to see what tags exist
-        try:
-            monitors = datadog_client.monitors_api.list_monitors()
-
-            if not monitors:
-                pytest.skip("No monitors available in account for testing")
+        if not all_monitors:
+            pytest.skip("No monitors available in account for testing")
 
+        try:
             # Get tags from first monitor (if any)
-            if monitors[0].tags:
-                test_tag = monitors[0].tags[0]
+            if all_monitors[0].tags:
+                test_tag = all_monitors[0].tags[0]
 
                 # Query with this tag
                 filtered_monitors = datadog_client.monitors_api.list_monitors(tags=test_tag)
@@ -6,7 +6,8 @@ and result aggregation.
 """
 
 import asyncio
-from unittest.mock import MagicMock
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -19,6 +20,13 @@ from guard.interfaces.check import Check, CheckContext
 class MockCheck(Check):
     """Mock check implementation for testing."""
 
+    # Plain class attributes shadow the Check properties, so __init__ can set
+    # them directly and lookups skip the property call
+    name: str = ""
+    description: str = ""
+    is_critical: bool = True
+    timeout_seconds: float = 60
+
     def __init__(
         self,
         check_name: str,
@@ -27,7 +35,7 @@ class MockCheck(Check):
         execution_delay: float = 0.0,
         will_raise: Exception | None = None,
         is_critical_check: bool = True,
-        timeout: int = 60,
+        timeout: float = 60,
     ):
         """Initialize mock check.
 
@@ -40,33 +48,19 @@ class MockCheck(Check):
             is_critical_check: Whether check is critical
             timeout: Check timeout in seconds
         """
-        self._name = check_name
-        self._description = check_description
-        self._will_pass = will_pass
+        self.name = check_name
+        self.description = check_description
         self._execution_delay = execution_delay
         self._will_raise = will_raise
-        self._is_critical = is_critical_check
-        self._timeout = timeout
-
-    @property
-    def name(self) -> str:
-        """Get check name."""
-        return self._name
-
-    @property
-    def description(self) -> str:
-        """Get check description."""
-        return self._description
-
-    @property
-    def is_critical(self) -> bool:
-        """Whether this is a critical check."""
-        return self._is_critical
-
-    @property
-    def timeout_seconds(self) -> int:
-        """Maximum execution time for this check."""
-        return self._timeout
+        self.is_critical = is_critical_check
+        self.timeout_seconds = timeout
+        # Built once and returned from every execute(); tests treat it as read-only
+        self._result = CheckResult(
+            check_name=check_name,
+            passed=will_pass,
+            message=f"Check {'passed' if will_pass else 'failed'}",
+            metrics={"test_metric": 1.0},
+        )
 
     async def execute(self, cluster: ClusterConfig, context: CheckContext) -> CheckResult:
         """Execute the health check."""
@@ -78,30 +72,51 @@ class MockCheck(Check):
         if self._will_raise:
             raise self._will_raise
 
-        # Return result
-        return CheckResult(
-            check_name=self.name,
-            passed=self._will_pass,
-            message=f"Check {'passed' if self._will_pass else 'failed'}",
-            metrics={"test_metric": 1.0},
-        )
+        return self._result
 
 
-@pytest.fixture
+def _make_check(name: str, passed: bool = True, critical: bool = True, timeout: int = 60) -> Mock:
+    """Build a check whose execute() immediately returns a fixed result.
+
+    Use MockCheck instead when a test needs an execution delay or an error.
+    """
+    check = Mock(spec=Check)
+    check.name = name
+    check.description = name
+    check.is_critical = critical
+    check.timeout_seconds = timeout
+    check.execute = AsyncMock(
+        return_value=CheckResult(check_name=name, passed=passed, message="", metrics={})
+    )
+    return check
+
+
+@pytest.fixture(scope="module")
 def registry() -> CheckRegistry:
-    """Provide a check registry."""
+    """Provide a check registry shared by the module and emptied after each test."""
     return CheckRegistry()
 
 
+@pytest.fixture(autouse=True)
+def reset_registry(registry: CheckRegistry) -> Iterator[None]:
+    """Clear the shared registry after each test."""
+    yield
+    registry.clear()
+
+
+# The mock checks never touch their providers, so plain sentinels stand in for them
+_SHARED_CONTEXT = CheckContext(
+    cloud_provider=object(),
+    kubernetes_provider=object(),
+    metrics_provider=object(),
+    extra_context={},
+)
+
+
 @pytest.fixture
 def mock_context() -> CheckContext:
-    """Provide a mock check context."""
-    return CheckContext(
-        cloud_provider=MagicMock(),
-        kubernetes_provider=MagicMock(),
-        metrics_provider=MagicMock(),
-        extra_context={},
-    )
+    """Provide a check context shared by the module; treat it as read-only."""
+    return _SHARED_CONTEXT
 
 
 class TestCheckOrchestratorInitialization:
@@ -128,107 +143,122 @@ class TestCheckOrchestratorInitialization:
         assert orchestrator.max_concurrent == 10
 
 
+@pytest.mark.xdist_group(name="orch_run_checks")
+@pytest.mark.asyncio(scope="module")
 class TestRunChecks:
     """Tests for run_checks method."""
 
-    @pytest.mark.asyncio
-    async def test_run_checks_all_pass(
+    @pytest.mark.parametrize(
+        ("specs", "fail_fast", "expected"),
+        [
+            ([(True, True), (True, True)], True, [True, True]),
+            # check3 shares check2's batch, so its result is dropped
+            ([(True, True), (False, True), (True, True)], True, [True, False]),
+            ([(True, True), (False, False), (True, True)], True, [True, False, True]),
+            ([(False, True), (False, True), (True, True)], False, [False, False, True]),
+        ],
+        ids=[
+            "all_pass",
+            "fail_fast_on_critical_failure",
+            "continue_on_non_critical_failure",
+            "no_fail_fast",
+        ],
+    )
+    async def test_run_checks(
         self,
         registry: CheckRegistry,
         sample_cluster_config: ClusterConfig,
         mock_context: CheckContext,
+        specs: list[tuple[bool, bool]],
+        fail_fast: bool,
+        expected: list[bool],
     ) -> None:
-        """Test running checks when all pass."""
-        check1 = MockCheck("check1", "First check", will_pass=True)
-        check2 = MockCheck("check2", "Second check", will_pass=True)
-
-        registry.register(check1)
-        registry.register(check2)
+        """Test which results run_checks returns for (will_pass, is_critical) specs."""
+        registry.register_many(
+            _make_check(f"check{i}", passed=will_pass, critical=critical)
+            for i, (will_pass, critical) in enumerate(specs, start=1)
+        )
 
-        orchestrator = CheckOrchestrator(registry)
+        orchestrator = CheckOrchestrator(registry, fail_fast=fail_fast)
         results = await orchestrator.run_checks(sample_cluster_config, mock_context)
 
-        assert len(results) == 2
-        assert all(r.passed for r in results)
-        assert results[0].check_name == "check1"
-        assert results[1].check_name == "check2"
+        assert [r.passed for r in results] == expected
+        assert [r.check_name for r in results] == [f"check{i}" for i in range(1, len(expected) + 1)]
 
-    @pytest.mark.asyncio
-    async def test_run_checks_fail_fast_on_failure(
+    async def test_run_checks_fail_fast_skips_later_batches(
         self,
         registry: CheckRegistry,
         sample_cluster_config: ClusterConfig,
         mock_context: CheckContext,
     ) -> None:
-        """Test that fail_fast stops on first critical failure."""
-        check1 = MockCheck("check1", "First check", will_pass=True)
-        check2 = MockCheck("check2", "Second check", will_pass=False, is_critical_check=True)
-        check3 = MockCheck("check3", "Third check", will_pass=True)
+        """Test that fail_fast does not start batches after a critical failure."""
+        check1 = _make_check("check1", passed=False)
+        check2 = _make_check("check2")
 
-        registry.register(check1)
-        registry.register(check2)
-        registry.register(check3)
+        registry.register_many([check1, check2])
 
-        orchestrator = CheckOrchestrator(registry, fail_fast=True)
+        orchestrator = CheckOrchestrator(registry, fail_fast=True, max_concurrent=1)
         results = await orchestrator.run_checks(sample_cluster_config, mock_context)
 
-        # Should stop after check2 fails
-        assert len(results) == 2
-        assert results[0].passed is True
-        assert results[1].passed is False
-        # check3 should not be executed
+        assert [r.check_name for r in results] == ["check1"]
+        check2.execute.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_run_checks_continue_on_non_critical_failure(
+    async def test_run_checks_fail_fast_cancels_rest_of_batch(
         self,
         registry: CheckRegistry,
         sample_cluster_config: ClusterConfig,
         mock_context: CheckContext,
     ) -> None:
-        """Test that non-critical failures don't stop execution."""
-        check1 = MockCheck("check1", "First check", will_pass=True)
-        check2 = MockCheck("check2", "Second check", will_pass=False, is_critical_check=False)
-        check3 = MockCheck("check3", "Third check", will_pass=True)
+        """Test that fail_fast cancels checks still running in the failing batch."""
+        check1 = _make_check("check1", passed=False)
+        slow_check = MockCheck("slow_check", "Slow check", execution_delay=30.0)
 
-        registry.register(check1)
-        registry.register(check2)
-        registry.register(check3)
+        registry.register_many([check1, slow_check])
 
         orchestrator = CheckOrchestrator(registry, fail_fast=True)
+        start = asyncio.get_running_loop().time()
         results = await orchestrator.run_checks(sample_cluster_config, mock_context)
 
-        # Should continue since check2 is non-critical
-        assert len(results) == 3
-        assert results[0].passed is True
-        assert results[1].passed is False
-        assert results[2].passed is True
+        assert [r.check_name for r in results] == ["check1"]
+        # slow_check was cancelled rather than waited out
+        assert asyncio.get_running_loop().time() - start < 5.0
+        assert asyncio.all_tasks() == {asyncio.current_task()}
 
-    @pytest.mark.asyncio
-    async def test_run_checks_no_fail_fast(
+    async def test_run_checks_runs_batch_concurrently(
         self,
         registry: CheckRegistry,
         sample_cluster_config: ClusterConfig,
         mock_context: CheckContext,
     ) -> None:
-        """Test running all checks when fail_fast is disabled."""
-        check1 = MockCheck("check1", "First check", will_pass=False)
-        check2 = MockCheck("check2", "Second check", will_pass=False)
-        check3 = MockCheck("check3", "Third check", will_pass=True)
+        """Test that checks run max_concurrent at a time, keeping result order."""
+        running = 0
+        peak = 0
 
-        registry.register(check1)
-        registry.register(check2)
-        registry.register(check3)
+        def track_concurrency(result: CheckResult):
+            async def execute(*args, **kwargs) -> CheckResult:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                # Yield so the rest of the batch gets a chance to start
+                await asyncio.sleep(0)
+                running -= 1
+                return result
 
-        orchestrator = CheckOrchestrator(registry, fail_fast=False)
+            return execute
+
+        checks = [_make_check(f"check{i}") for i in range(3)]
+        for check in checks:
+            check.execute.side_effect = track_concurrency(check.execute.return_value)
+
+        registry.register_many(checks)
+
+        orchestrator = CheckOrchestrator(registry, max_concurrent=2)
         results = await orchestrator.run_checks(sample_cluster_config, mock_context)
 
-        # All checks should run
-        assert len(results) == 3
-        assert results[0].passed is False
-        assert results[1].passed is False
-        assert results[2].passed is True
+        assert [r.check_name for r in results] == ["check0", "check1", "check2"]
+        # Never more than one batch in flight at once
+        assert peak == 2
 
-    @pytest.mark.asyncio
     async def test_run_checks_handles_timeout(
         self,
         registry: CheckRegistry,
@@ -240,8 +270,8 @@ class TestRunChecks:
         slow_check = MockCheck(
             "slow_check",
             "Slow check",
-            execution_delay=2.0,
-            timeout=1,  # 1 second timeout
+            execution_delay=1.0,
+            timeout=0.01,
         )
 
         registry.register(slow_check)
@@ -252,8 +282,10 @@ class TestRunChecks:
         assert len(results) == 1
         assert results[0].passed is False
         assert "timed out" in results[0].message.lower()
+        assert results[0].message == "Check timed out after 0.01 seconds"
+        # The timed-out check was cancelled in place, leaving no stray task
+        assert asyncio.all_tasks() == {asyncio.current_task()}
 
-    @pytest.mark.asyncio
     async def test_run_checks_handles_exception(
         self,
         registry: CheckRegistry,
@@ -276,7 +308,6 @@ class TestRunChecks:
         assert results[0].passed is False
         assert "Check execution failed" in results[0].message
 
-    @pytest.mark.asyncio
     async def test_run_checks_empty_registry(
         self,
         registry: CheckRegistry,
@@ -290,10 +321,11 @@ class TestRunChecks:
         assert results == []
 
 
+@pytest.mark.xdist_group(name="orch_run_specific_checks")
+@pytest.mark.asyncio(scope="module")
 class TestRunSpecificChecks:
     """Tests for run_specific_checks method."""
 
-    @pytest.mark.asyncio
     async def test_run_specific_checks_by_name(
         self,
         registry: CheckRegistry,
@@ -301,13 +333,11 @@ class TestRunSpecificChecks:
         mock_context: CheckContext,
     ) -> None:
         """Test running specific checks by name."""
-        check1 = MockCheck("check1", "First check", will_pass=True)
-        check2 = MockCheck("check2", "Second check", will_pass=True)
-        check3 = MockCheck("check3", "Third check", will_pass=True)
+        check1 = _make_check("check1")
+        check2 = _make_check("check2")
+        check3 = _make_check("check3")
 
-        registry.register(check1)
-        registry.register(check2)
-        registry.register(check3)
+        registry.register_many([check1, check2, check3])
 
         orchestrator = CheckOrchestrator(registry)
         results = await orchestrator.run_specific_checks(
@@ -319,8 +349,30 @@ class TestRunSpecificChecks:
         assert len(results) == 2
         assert results[0].check_name == "check1"
         assert results[1].check_name == "check3"
+        check2.execute.assert_not_awaited()
+
+    async def test_run_specific_checks_large_set(
+        self,
+        registry: CheckRegistry,
+        sample_cluster_config: ClusterConfig,
+        mock_context: CheckContext,
+    ) -> None:
+        """Test that each requested name costs one lookup, not a registry scan."""
+        registry.register_many(MockCheck(f"check{i}", f"Check {i}") for i in range(1000))
+        check_names = [f"check{i}" for i in reversed(range(1000))]
+
+        orchestrator = CheckOrchestrator(registry)
+        with patch.object(registry, "get_check", wraps=registry.get_check) as get_check:
+            results = await orchestrator.run_specific_checks(
+                sample_cluster_config,
+                mock_context,
+                check_names=check_names,
+            )
+
+        assert get_check.call_count == len(check_names)
+        # Results follow the requested order, not registration order
+        assert [r.check_name for r in results] == check_names
 
-    @pytest.mark.asyncio
     async def test_run_specific_checks_not_found(
         self,
         registry: CheckRegistry,
@@ -328,7 +380,7 @@ class TestRunSpecificChecks:
         mock_context: CheckContext,
     ) -> None:
         """Test running specific checks when some don't exist."""
-        check1 = MockCheck("check1", "First check", will_pass=True)
+        check1 = _make_check("check1")
         registry.register(check1)
 
         orchestrator = CheckOrchestrator(registry)
@@ -342,7 +394,6 @@ class TestRunSpecificChecks:
         assert len(results) == 1
         assert results[0].check_name == "check1"
 
-    @pytest.mark.asyncio
     async def test_run_specific_checks_handles_exception(
         self,
         registry: CheckRegistry,
@@ -369,10 +420,11 @@ class TestRunSpecificChecks:
         assert "Test error" in results[0].message
 
 
+@pytest.mark.xdist_group(name="orch_run_critical_checks_only")
+@pytest.mark.asyncio(scope="module")
 class TestRunCriticalChecksOnly:
     """Tests for run_critical_checks_only method."""
 
-    @pytest.mark.asyncio
     async def test_run_critical_checks_only(
         self,
         registry: CheckRegistry,
@@ -380,13 +432,11 @@ class TestRunCriticalChecksOnly:
         mock_context: CheckContext,
     ) -> None:
         """Test running only critical checks."""
-        critical1 = MockCheck("critical1", "Critical check 1", is_critical_check=True)
-        non_critical = MockCheck("non_critical", "Non-critical check", is_critical_check=False)
-        critical2 = MockCheck("critical2", "Critical check 2", is_critical_check=True)
+        critical1 = _make_check("critical1")
+        non_critical = _make_check("non_critical", critical=False)
+        critical2 = _make_check("critical2")
 
-        registry.register(critical1)
-        registry.register(non_critical)
-        registry.register(critical2)
+        registry.register_many([critical1, non_critical, critical2])
 
         orchestrator = CheckOrchestrator(registry)
         results = await orchestrator.run_critical_checks_only(sample_cluster_config, mock_context)
@@ -398,7 +448,6 @@ class TestRunCriticalChecksOnly:
         assert "critical2" in check_names
         assert "non_critical" not in check_names
 
-    @pytest.mark.asyncio
     async def test_run_critical_checks_fail_fast(
         self,
         registry: CheckRegistry,
@@ -406,13 +455,11 @@ class TestRunCriticalChecksOnly:
         mock_context: CheckContext,
     ) -> None:
         """Test that critical checks stop on first failure when fail_fast enabled."""
-        critical1 = MockCheck("critical1", "Critical 1", will_pass=True, is_critical_check=True)
-        critical2 = MockCheck("critical2", "Critical 2", will_pass=False, is_critical_check=True)
-        critical3 = MockCheck("critical3", "Critical 3", will_pass=True, is_critical_check=True)
+        critical1 = _make_check("critical1")
+        critical2 = _make_check("critical2", passed=False)
+        critical3 = _make_check("critical3")
 
-        registry.register(critical1)
-        registry.register(critical2)
-        registry.register(critical3)
+        registry.register_many([critical1, critical2, critical3])
 
         orchestrator = CheckOrchestrator(registry, fail_fast=True)
         results = await orchestrator.run_critical_checks_only(sample_cluster_config, mock_context)
@@ -421,8 +468,8 @@ class TestRunCriticalChecksOnly:
         assert len(results) == 2
         assert results[0].passed is True
         assert results[1].passed is False
+        critical3.execute.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_run_critical_checks_handles_exception(
         self,
         registry: CheckRegistry,
@@ -445,7 +492,6 @@ class TestRunCriticalChecksOnly:
         assert results[0].passed is False
         assert "Critical failure" in results[0].message
 
-    @pytest.mark.asyncio
     async def test_run_critical_checks_no_critical_checks(
         self,
         registry: CheckRegistry,
@@ -453,7 +499,7 @@ class TestRunCriticalChecksOnly:
         mock_context: CheckContext,
     ) -> None:
         """Test running critical checks when none are registered."""
-        non_critical = MockCheck("non_critical", "Non-critical", is_critical_check=False)
+        non_critical = _make_check("non_critical", critical=False)
         registry.register(non_critical)
 
         orchestrator = CheckOrchestrator(registry)
@@ -462,10 +508,10 @@ class TestRunCriticalChecksOnly:
         assert results == []
 
 
+@pytest.mark.asyncio(scope="module")
 class TestResultAggregation:
     """Tests for result aggregation and logging."""
 
-    @pytest.mark.asyncio
     async def test_result_aggregation_mixed_results(
         self,
         registry: CheckRegistry,
@@ -473,20 +519,19 @@ class TestResultAggregation:
         mock_context: CheckContext,
     ) -> None:
         """Test that results are properly aggregated."""
-        check1 = MockCheck("check1", "Check 1", will_pass=True)
-        check2 = MockCheck("check2", "Check 2", will_pass=False, is_critical_check=False)
-        check3 = MockCheck("check3", "Check 3", will_pass=True)
+        check1 = _make_check("check1")
+        check2 = _make_check("check2", passed=False, critical=False)
+        check3 = _make_check("check3")
 
-        registry.register(check1)
-        registry.register(check2)
-        registry.register(check3)
+        registry.register_many([check1, check2, check3])
 
         orchestrator = CheckOrchestrator(registry, fail_fast=False)
         results = await orchestrator.run_checks(sample_cluster_config, mock_context)
 
         assert len(results) == 3
-        passed_count = sum(1 for r in results if r.passed)
-        failed_count = sum(1 for r in results if not r.passed)
+        passed_flags = [r.passed for r in results]
+        passed_count = passed_flags.count(True)
+        failed_count = passed_flags.count(False)
 
         assert passed_count == 2
         assert failed_count == 1
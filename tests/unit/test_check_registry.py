@@ -16,6 +16,13 @@ from guard.interfaces.check import Check, CheckContext
 class MockCheck(Check):
     """Mock check implementation for testing."""
 
+    # Plain class attributes shadow the Check properties, so __init__ can set
+    # them directly and lookups skip the property call
+    name: str = ""
+    description: str = ""
+    is_critical: bool = True
+    timeout_seconds: int = 60
+
     def __init__(
         self,
         check_name: str,
@@ -31,30 +38,10 @@ class MockCheck(Check):
             is_critical_check: Whether check is critical
             timeout: Check timeout in seconds
         """
-        self._name = check_name
-        self._description = check_description
-        self._is_critical = is_critical_check
-        self._timeout = timeout
-
-    @property
-    def name(self) -> str:
-        """Get check name."""
-        return self._name
-
-    @property
-    def description(self) -> str:
-        """Get check description."""
-        return self._description
-
-    @property
-    def is_critical(self) -> bool:
-        """Whether this is a critical check."""
-        return self._is_critical
-
-    @property
-    def timeout_seconds(self) -> int:
-        """Maximum execution time for this check."""
-        return self._timeout
+        self.name = check_name
+        self.description = check_description
+        self.is_critical = is_critical_check
+        self.timeout_seconds = timeout
 
     async def execute(self, cluster: ClusterConfig, context: CheckContext) -> CheckResult:
         """Execute the health check."""
@@ -102,8 +89,8 @@ class TestCheckRegistryInitialization:
 
     def test_registry_internal_structures_initialized(self, registry: CheckRegistry) -> None:
         """Test that internal data structures are initialized correctly."""
-        assert registry._checks == []
         assert registry._checks_by_name == {}
+        assert registry._critical_checks == {}
 
 
 class TestCheckRegistration:
@@ -149,6 +136,27 @@ class TestCheckRegistration:
         # First registered check should be kept
         assert registry.get_check("duplicate_name") == check1
 
+    def test_register_many_preserves_order(self, registry: CheckRegistry) -> None:
+        """Test bulk registration keeps the given execution order."""
+        checks = [MockCheck(f"check{i}", f"Check {i}") for i in range(3)]
+
+        registry.register_many(checks)
+
+        assert registry.get_all_checks() == checks
+        assert registry.get_check("check1") is checks[1]
+
+    def test_register_many_skips_duplicates(
+        self, registry: CheckRegistry, sample_check: MockCheck
+    ) -> None:
+        """Test bulk registration skips names already registered or repeated in the batch."""
+        registry.register(sample_check)
+        repeat = MockCheck("new_check", "Repeated name")
+        new_check = MockCheck("new_check", "New check")
+
+        registry.register_many([MockCheck("sample_check", "Duplicate"), new_check, repeat])
+
+        assert registry.get_all_checks() == [sample_check, new_check]
+
 
 class TestCheckRetrieval:
     """Tests for check retrieval."""
@@ -206,17 +214,16 @@ class TestCheckUnregistration:
         result = registry.unregister("nonexistent_check")
         assert result is False
 
-    def test_unregister_removes_from_both_structures(
+    def test_unregister_removes_from_internal_structure(
         self, registry: CheckRegistry, sample_check: MockCheck
     ) -> None:
-        """Test that unregister removes from both internal structures."""
+        """Test that unregister removes the check from the internal mapping."""
         registry.register(sample_check)
 
         registry.unregister("sample_check")
 
-        # Check both internal structures are updated
-        assert sample_check not in registry._checks
         assert "sample_check" not in registry._checks_by_name
+        assert registry.get_all_checks() == []
 
 
 class TestCriticalCheckFiltering:
@@ -258,6 +265,17 @@ class TestCriticalCheckFiltering:
         assert check1 in critical_checks
         assert check2 in critical_checks
 
+    def test_get_critical_checks_preserves_order_after_unregister(
+        self, registry: CheckRegistry, non_critical_check: MockCheck
+    ) -> None:
+        """Test critical checks keep registration order and drop unregistered checks."""
+        checks = [MockCheck(f"critical{i}", f"Critical {i}") for i in range(3)]
+        registry.register_many([checks[0], non_critical_check, checks[1], checks[2]])
+
+        registry.unregister("critical1")
+
+        assert registry.get_critical_checks() == [checks[0], checks[2]]
+
 
 class TestClusterSpecificChecks:
     """Tests for cluster-specific check retrieval."""
@@ -314,13 +332,13 @@ class TestRegistryClear:
     def test_clear_updates_internal_structures(
         self, registry: CheckRegistry, sample_check: MockCheck
     ) -> None:
-        """Test that clear updates both internal structures."""
+        """Test that clear empties the internal mapping."""
         registry.register(sample_check)
 
         registry.clear()
 
-        assert registry._checks == []
         assert registry._checks_by_name == {}
+        assert registry._critical_checks == {}
 
 
 class TestRegistryLenOperator:
@@ -5,8 +5,11 @@ and validate. Tests focus on command parsing, option validation, and ensuring
 proper orchestrator calls with mocked dependencies.
 """
 
+from collections.abc import Iterator
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -18,15 +21,15 @@ from guard.core.models import CheckResult, ClusterConfig, DatadogTags
 from guard.interfaces.validator import ValidationResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Provide a Click CLI test runner."""
+    """Provide a Click CLI test runner, shared since invoke() keeps no state."""
     return CliRunner()
 
 
-@pytest.fixture
-def mock_config_file(tmp_path: Path) -> Path:
-    """Create a temporary config file for testing."""
+@pytest.fixture(scope="session")
+def mock_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary config file shared by the session; treat it as read-only."""
     config_content = """
 aws:
   region: us-east-1
@@ -39,14 +42,42 @@ gitlab:
   url: https://gitlab.example.com
   token: test-token
 """
-    config_file = tmp_path / "config.yaml"
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
     config_file.write_text(config_content)
     return config_file
 
 
+@pytest.fixture(autouse=True)
+def mock_config_from_file() -> Iterator[MagicMock]:
+    """Patch GuardConfig.from_file to return a stub config for every test.
+
+    Tests that need config loading to fail set side_effect on the yielded mock.
+    """
+    with patch("guard.core.config.GuardConfig.from_file") as mock_from_file:
+        mock_from_file.return_value = MagicMock(
+            aws=MagicMock(region="us-east-1"),
+            datadog=MagicMock(api_key="test", app_key="test"),
+            gitlab=MagicMock(url="https://gitlab.com", token="test"),
+        )
+        yield mock_from_file
+
+
+@pytest.fixture(autouse=True)
+def no_asyncio_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the monitor soak period and any other awaited sleeps."""
+
+    async def _no_sleep(_delay: float, result: object = None) -> object:
+        return result
+
+    monkeypatch.setattr("asyncio.sleep", _no_sleep)
+
+
 @pytest.fixture
 def sample_clusters() -> list[ClusterConfig]:
-    """Provide sample cluster configurations."""
+    """Provide sample cluster configurations.
+
+    Function-scoped because the run command mutates the clusters it upgrades.
+    """
     return [
         ClusterConfig(
             cluster_id="eks-test-us-east-1",
@@ -79,23 +110,93 @@ def sample_clusters() -> list[ClusterConfig]:
     ]
 
 
-@pytest.fixture
-def mock_guard_context(mock_config_file: Path, sample_clusters: list[ClusterConfig]) -> MagicMock:
-    """Create a mock GuardContext for testing."""
+@pytest.fixture(scope="session")
+def passed_check_results() -> list[CheckResult]:
+    """Passing pre-check results shared by the session; treat them as read-only."""
+    return [CheckResult(check_name="test_check", passed=True, message="Success", metrics={})]
+
+
+@pytest.fixture(scope="session")
+def failed_check_results() -> list[CheckResult]:
+    """Failing pre-check results shared by the session; treat them as read-only."""
+    return [CheckResult(check_name="test_check", passed=False, message="Check failed", metrics={})]
+
+
+@pytest.fixture(scope="session")
+def passed_validation_results() -> list[ValidationResult]:
+    """Passing validation results shared by the session; treat them as read-only."""
+    return [
+        ValidationResult(
+            cluster_id="eks-test-us-east-1",
+            validator_name="test_validator",
+            passed=True,
+            violations=[],
+            metrics={},
+            timestamp=datetime.now(),
+        )
+    ]
+
+
+@pytest.fixture(scope="session")
+def _guard_context_template(mock_config_file: Path) -> MagicMock:
+    """Build the spec'd GuardContext mock once; mock_guard_context resets it per test."""
+    # Imported here, like guard.cli.main does, so only tests using this fixture pay for
+    # loading the adapters and their SDKs
+    from guard.adapters.aws_adapter import AWSAdapter
+    from guard.adapters.datadog_adapter import DatadogAdapter
+    from guard.adapters.gitlab_adapter import GitLabAdapter
+    from guard.gitops.updaters.istio_helm_updater import IstioHelmUpdater
+    from guard.registry.cluster_registry import ClusterRegistry
+
     mock_ctx = MagicMock()
     mock_ctx.config_path = str(mock_config_file)
-    mock_ctx.registry.get_clusters_by_batch.return_value = sample_clusters
-    mock_ctx.registry.list_all_clusters.return_value = sample_clusters
-    mock_ctx.registry.update_cluster_status = MagicMock()
-    mock_ctx.aws_adapter = MagicMock()
-    mock_ctx.datadog_adapter = MagicMock()
-    mock_ctx.gitlab_adapter = MagicMock()
-    mock_ctx.helm_updater = MagicMock()
+    mock_ctx.registry = MagicMock(spec=ClusterRegistry)
+    mock_ctx.aws_adapter = MagicMock(spec=AWSAdapter)
+    mock_ctx.datadog_adapter = MagicMock(spec=DatadogAdapter)
+    mock_ctx.gitlab_adapter = MagicMock(spec=GitLabAdapter)
+    mock_ctx.helm_updater = MagicMock(spec=IstioHelmUpdater)
     mock_ctx.config.gitlab.url = "https://gitlab.com"
     mock_ctx.gitlab_token = "test-token"
     return mock_ctx
 
 
+@pytest.fixture
+def mock_guard_context(
+    _guard_context_template: MagicMock, sample_clusters: list[ClusterConfig]
+) -> MagicMock:
+    """Provide the shared GuardContext mock with calls and stubbed returns cleared."""
+    mock_ctx = _guard_context_template
+    mock_ctx.reset_mock(return_value=True, side_effect=True)
+    mock_ctx.registry.get_clusters_by_batch.return_value = sample_clusters
+    mock_ctx.registry.list_all_clusters.return_value = sample_clusters
+    return mock_ctx
+
+
+@pytest.fixture
+def run_command_patches(
+    mock_guard_context: MagicMock, passed_check_results: list[CheckResult]
+) -> Iterator[SimpleNamespace]:
+    """Patch the run command's collaborators with passing checks and a created MR.
+
+    Yields:
+        Namespace with the GuardContext mock (ctx) and the CheckOrchestrator
+        (orch) and GitOpsOrchestrator (gitops) class mocks
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch("guard.cli.main.GuardContext", return_value=mock_guard_context))
+        orch = stack.enter_context(patch("guard.checks.check_orchestrator.CheckOrchestrator"))
+        gitops = stack.enter_context(patch("guard.gitops.gitops_orchestrator.GitOpsOrchestrator"))
+        stack.enter_context(patch("guard.services.istio.istio_service.IstioService"))
+        stack.enter_context(patch("guard.adapters.k8s_adapter.KubernetesAdapter"))
+
+        orch.return_value.run_checks = AsyncMock(return_value=passed_check_results)
+        gitops.return_value.create_upgrade_mr = AsyncMock(
+            return_value=MagicMock(web_url="https://gitlab.com/mr/123")
+        )
+
+        yield SimpleNamespace(ctx=mock_guard_context, orch=orch, gitops=gitops)
+
+
 # ==============================================================================
 # CLI Group Tests
 # ==============================================================================
@@ -130,187 +231,153 @@ def test_cli_help_lists_all_commands(cli_runner: CliRunner) -> None:
     assert "validate" in result.output
 
 
-def test_cli_custom_config_path(cli_runner: CliRunner, mock_config_file: Path) -> None:
+def test_cli_custom_config_path(
+    cli_runner: CliRunner, mock_config_file: Path, mock_config_from_file: MagicMock
+) -> None:
     """Test that custom config path is passed to commands."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_from_file:
-        mock_from_file.return_value = MagicMock(aws=MagicMock(region="us-east-1"))
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
-                mock_registry_instance = MagicMock()
-                mock_registry_instance.list_all_clusters = MagicMock(return_value=[])
-                mock_registry.return_value = mock_registry_instance
-
-                result = cli_runner.invoke(
-                    cli,
-                    ["--config", str(mock_config_file), "list"],
-                )
+    with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
+        with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
+            mock_registry_instance = MagicMock()
+            mock_registry_instance.list_all_clusters = MagicMock(return_value=[])
+            mock_registry.return_value = mock_registry_instance
+
+            result = cli_runner.invoke(
+                cli,
+                ["--config", str(mock_config_file), "list"],
+            )
 
-                assert result.exit_code == 0
-                # Verify config was loaded from the custom path
-                mock_from_file.assert_called_once_with(str(mock_config_file))
+            assert result.exit_code == 0
+            # Verify config was loaded from the custom path
+            mock_config_from_file.assert_called_once_with(str(mock_config_file))
 
 
 # ==============================================================================
-# Run Command Tests
+# Option Validation Tests
 # ==============================================================================
 
 
-def test_run_command_requires_batch(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test that run command requires --batch option."""
-    result = cli_runner.invoke(
-        cli,
-        ["--config", str(mock_config_file), "run", "--target-version", "1.20.0"],
-    )
+@pytest.mark.parametrize(
+    ("args", "missing"),
+    [
+        (["run", "--target-version", "1.20.0"], "--batch"),
+        (["run", "--batch", "test"], "--target-version"),
+        (["monitor"], "--batch"),
+        (["rollback", "--reason", "test"], "--batch"),
+        (["rollback", "--batch", "test"], "--reason"),
+    ],
+    ids=[
+        "run_batch",
+        "run_target_version",
+        "monitor_batch",
+        "rollback_batch",
+        "rollback_reason",
+    ],
+)
+def test_command_requires_option(
+    cli_runner: CliRunner, mock_config_file: Path, args: list[str], missing: str
+) -> None:
+    """Test that commands fail when a required option is missing."""
+    result = cli_runner.invoke(cli, ["--config", str(mock_config_file), *args])
 
     assert result.exit_code != 0
-    assert "Missing option '--batch'" in result.output or "Error" in result.output
+    assert f"Missing option '{missing}'" in result.output
 
 
-def test_run_command_requires_target_version(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test that run command requires --target-version option."""
-    result = cli_runner.invoke(
-        cli,
-        ["--config", str(mock_config_file), "run", "--batch", "test"],
-    )
-
-    assert result.exit_code != 0
-    assert "Missing option '--target-version'" in result.output or "Error" in result.output
+# ==============================================================================
+# Run Command Tests
+# ==============================================================================
 
 
+@pytest.mark.xdist_group(name="cli_run_command")
 def test_run_command_success(
     cli_runner: CliRunner,
     mock_config_file: Path,
-    sample_clusters: list[ClusterConfig],
+    run_command_patches: SimpleNamespace,
 ) -> None:
     """Test successful run command execution."""
-    mock_check_results = [
-        CheckResult(check_name="test_check", passed=True, message="Success", metrics={})
-    ]
-
-    # Create a mock GuardContext
-    mock_ctx = MagicMock()
-    mock_ctx.config_path = str(mock_config_file)
-    mock_ctx.registry.get_clusters_by_batch.return_value = sample_clusters
-    mock_ctx.aws_adapter = MagicMock()
-    mock_ctx.datadog_adapter = MagicMock()
-    mock_ctx.gitlab_adapter = MagicMock()
-    mock_ctx.helm_updater = MagicMock()
-
-    with patch("guard.cli.main.GuardContext", return_value=mock_ctx):
-        with patch("guard.checks.check_orchestrator.CheckOrchestrator") as mock_orch:
-            mock_orch_instance = MagicMock()
-            mock_orch_instance.run_checks = AsyncMock(return_value=mock_check_results)
-            mock_orch.return_value = mock_orch_instance
-
-            with patch("guard.gitops.gitops_orchestrator.GitOpsOrchestrator") as mock_gitops:
-                mock_gitops_instance = MagicMock()
-                mock_mr = MagicMock()
-                mock_mr.web_url = "https://gitlab.com/mr/123"
-                mock_gitops_instance.create_upgrade_mr = AsyncMock(return_value=mock_mr)
-                mock_gitops.return_value = mock_gitops_instance
-
-                with patch("guard.services.istio.istio_service.IstioService"):
-                    with patch("guard.adapters.k8s_adapter.KubernetesAdapter"):
-                        result = cli_runner.invoke(
-                            cli,
-                            [
-                                "--config",
-                                str(mock_config_file),
-                                "run",
-                                "--batch",
-                                "test-batch",
-                                "--target-version",
-                                "1.20.0",
-                            ],
-                        )
+    result = cli_runner.invoke(
+        cli,
+        [
+            "--config",
+            str(mock_config_file),
+            "run",
+            "--batch",
+            "test-batch",
+            "--target-version",
+            "1.20.0",
+        ],
+    )
 
-                        assert result.exit_code == 0
-                        assert "GUARD Run Command" in result.output
-                        assert "test-batch" in result.output
-                        assert "1.20.0" in result.output
-                        assert "Success: 2" in result.output
+    assert result.exit_code == 0
+    assert "GUARD Run Command" in result.output
+    assert "test-batch" in result.output
+    assert "1.20.0" in result.output
+    assert "Success: 2" in result.output
 
 
+@pytest.mark.xdist_group(name="cli_run_command")
 def test_run_command_dry_run(
     cli_runner: CliRunner,
     mock_config_file: Path,
-    sample_clusters: list[ClusterConfig],
+    run_command_patches: SimpleNamespace,
 ) -> None:
     """Test run command with --dry-run flag."""
-    mock_check_results = [
-        CheckResult(check_name="test_check", passed=True, message="Success", metrics={})
-    ]
-
-    # Create a mock GuardContext
-    mock_ctx = MagicMock()
-    mock_ctx.config_path = str(mock_config_file)
-    mock_ctx.registry.get_clusters_by_batch.return_value = sample_clusters
-    mock_ctx.aws_adapter = MagicMock()
-    mock_ctx.datadog_adapter = MagicMock()
-    mock_ctx.gitlab_adapter = MagicMock()
-    mock_ctx.helm_updater = MagicMock()
-
-    with patch("guard.cli.main.GuardContext", return_value=mock_ctx):
-        with patch("guard.checks.check_orchestrator.CheckOrchestrator") as mock_orch:
-            mock_orch_instance = MagicMock()
-            mock_orch_instance.run_checks = AsyncMock(return_value=mock_check_results)
-            mock_orch.return_value = mock_orch_instance
-
-            with patch("guard.services.istio.istio_service.IstioService"):
-                with patch("guard.adapters.k8s_adapter.KubernetesAdapter"):
-                    result = cli_runner.invoke(
-                        cli,
-                        [
-                            "--config",
-                            str(mock_config_file),
-                            "run",
-                            "--batch",
-                            "test-batch",
-                            "--target-version",
-                            "1.20.0",
-                            "--dry-run",
-                        ],
-                    )
+    result = cli_runner.invoke(
+        cli,
+        [
+            "--config",
+            str(mock_config_file),
+            "run",
+            "--batch",
+            "test-batch",
+            "--target-version",
+            "1.20.0",
+            "--dry-run",
+        ],
+    )
 
-                    assert result.exit_code == 0
-                    assert "Dry-run: Skipping MR creation" in result.output
+    assert result.exit_code == 0
+    assert "Dry-run: Skipping MR creation" in result.output
+    run_command_patches.gitops.return_value.create_upgrade_mr.assert_not_awaited()
 
 
+@pytest.mark.xdist_group(name="cli_run_command")
 def test_run_command_max_concurrent(
     cli_runner: CliRunner,
     mock_config_file: Path,
-    sample_clusters: list[ClusterConfig],
+    run_command_patches: SimpleNamespace,
 ) -> None:
     """Test run command with --max-concurrent option."""
-    mock_check_results = [
-        CheckResult(check_name="test_check", passed=True, message="Success", metrics={})
-    ]
+    result = cli_runner.invoke(
+        cli,
+        [
+            "--config",
+            str(mock_config_file),
+            "run",
+            "--batch",
+            "test-batch",
+            "--target-version",
+            "1.20.0",
+            "--max-concurrent",
+            "10",
+        ],
+    )
 
-    # Create a mock GuardContext
-    mock_ctx = MagicMock()
-    mock_ctx.config_path = str(mock_config_file)
-    mock_ctx.registry.get_clusters_by_batch.return_value = sample_clusters
-    mock_ctx.aws_adapter = MagicMock()
-    mock_ctx.datadog_adapter = MagicMock()
-    mock_ctx.gitlab_adapter = MagicMock()
-    mock_ctx.helm_updater = MagicMock()
+    assert result.exit_code == 0
+    assert "Max Concurrent: 10" in result.output
 
-    with patch("guard.cli.main.GuardContext", return_value=mock_ctx):
-        with patch("guard.checks.check_orchestrator.CheckOrchestrator") as mock_orch:
-            mock_orch_instance = MagicMock()
-            mock_orch_instance.run_checks = AsyncMock(return_value=mock_check_results)
-            mock_orch.return_value = mock_orch_instance
-
-            with patch("guard.gitops.gitops_orchestrator.GitOpsOrchestrator") as mock_gitops:
-                mock_gitops_instance = MagicMock()
-                mock_mr = MagicMock()
-                mock_mr.web_url = "https://gitlab.com/mr/123"
-                mock_gitops_instance.create_upgrade_mr = AsyncMock(return_value=mock_mr)
-                mock_gitops.return_value = mock_gitops_instance
-
-                with patch("guard.services.istio.istio_service.IstioService"):
-                    with patch("guard.adapters.k8s_adapter.KubernetesAdapter"):
+
+def test_run_command_no_clusters_found(cli_runner: CliRunner, mock_config_file: Path) -> None:
+    """Test run command when no clusters are found for batch."""
+    with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
+        with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
+            mock_registry_instance = MagicMock()
+            mock_registry_instance.get_clusters_by_batch = MagicMock(return_value=[])
+            mock_registry.return_value = mock_registry_instance
+
+            with patch("guard.adapters.aws_adapter.AWSAdapter"):
+                with patch("guard.adapters.datadog_adapter.DatadogAdapter"):
+                    with patch("guard.adapters.gitlab_adapter.GitLabAdapter"):
                         result = cli_runner.invoke(
                             cli,
                             [
@@ -318,96 +385,44 @@ def test_run_command_max_concurrent(
                                 str(mock_config_file),
                                 "run",
                                 "--batch",
-                                "test-batch",
+                                "nonexistent-batch",
                                 "--target-version",
                                 "1.20.0",
-                                "--max-concurrent",
-                                "10",
                             ],
                         )
 
                         assert result.exit_code == 0
-                        assert "Max Concurrent: 10" in result.output
-
-
-def test_run_command_no_clusters_found(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test run command when no clusters are found for batch."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.return_value = MagicMock(
-            aws=MagicMock(region="us-east-1"),
-            datadog=MagicMock(api_key="test", app_key="test"),
-            gitlab=MagicMock(url="https://gitlab.com", token="test"),
-        )
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
-                mock_registry_instance = MagicMock()
-                mock_registry_instance.get_clusters_by_batch = MagicMock(return_value=[])
-                mock_registry.return_value = mock_registry_instance
-
-                with patch("guard.adapters.aws_adapter.AWSAdapter"):
-                    with patch("guard.adapters.datadog_adapter.DatadogAdapter"):
-                        with patch("guard.adapters.gitlab_adapter.GitLabAdapter"):
-                            result = cli_runner.invoke(
-                                cli,
-                                [
-                                    "--config",
-                                    str(mock_config_file),
-                                    "run",
-                                    "--batch",
-                                    "nonexistent-batch",
-                                    "--target-version",
-                                    "1.20.0",
-                                ],
-                            )
-
-                            assert result.exit_code == 0
-                            assert "No clusters found" in result.output
+                        assert "No clusters found" in result.output
 
 
+@pytest.mark.xdist_group(name="cli_run_command")
 def test_run_command_pre_check_failure(
     cli_runner: CliRunner,
     mock_config_file: Path,
     sample_clusters: list[ClusterConfig],
+    failed_check_results: list[CheckResult],
+    run_command_patches: SimpleNamespace,
 ) -> None:
     """Test run command when pre-checks fail."""
-    mock_check_results = [
-        CheckResult(check_name="test_check", passed=False, message="Check failed", metrics={})
-    ]
+    run_command_patches.ctx.registry.get_clusters_by_batch.return_value = [sample_clusters[0]]
+    run_command_patches.orch.return_value.run_checks.return_value = failed_check_results
 
-    # Create a mock GuardContext
-    mock_ctx = MagicMock()
-    mock_ctx.config_path = str(mock_config_file)
-    mock_ctx.registry.get_clusters_by_batch.return_value = [sample_clusters[0]]
-    mock_ctx.aws_adapter = MagicMock()
-    mock_ctx.datadog_adapter = MagicMock()
-    mock_ctx.gitlab_adapter = MagicMock()
-    mock_ctx.helm_updater = MagicMock()
-
-    with patch("guard.cli.main.GuardContext", return_value=mock_ctx):
-        with patch("guard.checks.check_orchestrator.CheckOrchestrator") as mock_orch:
-            mock_orch_instance = MagicMock()
-            mock_orch_instance.run_checks = AsyncMock(return_value=mock_check_results)
-            mock_orch.return_value = mock_orch_instance
-
-            with patch("guard.services.istio.istio_service.IstioService"):
-                with patch("guard.adapters.k8s_adapter.KubernetesAdapter"):
-                    result = cli_runner.invoke(
-                        cli,
-                        [
-                            "--config",
-                            str(mock_config_file),
-                            "run",
-                            "--batch",
-                            "test-batch",
-                            "--target-version",
-                            "1.20.0",
-                        ],
-                    )
+    result = cli_runner.invoke(
+        cli,
+        [
+            "--config",
+            str(mock_config_file),
+            "run",
+            "--batch",
+            "test-batch",
+            "--target-version",
+            "1.20.0",
+        ],
+    )
 
-                    assert result.exit_code == 0
-                    assert "Pre-checks failed" in result.output
-                    assert "Failed: 1" in result.output
+    assert result.exit_code == 0
+    assert "Pre-checks failed" in result.output
+    assert "Failed: 1" in result.output
 
 
 # ==============================================================================
@@ -415,31 +430,13 @@ def test_run_command_pre_check_failure(
 # ==============================================================================
 
 
-def test_monitor_command_requires_batch(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test that monitor command requires --batch option."""
-    result = cli_runner.invoke(cli, ["--config", str(mock_config_file), "monitor"])
-
-    assert result.exit_code != 0
-    assert "Missing option '--batch'" in result.output or "Error" in result.output
-
-
 def test_monitor_command_success(
     cli_runner: CliRunner,
     mock_config_file: Path,
     sample_clusters: list[ClusterConfig],
+    passed_validation_results: list[ValidationResult],
 ) -> None:
     """Test successful monitor command execution."""
-    mock_validation_results = [
-        ValidationResult(
-            cluster_id="eks-test-us-east-1",
-            validator_name="test_validator",
-            passed=True,
-            violations=[],
-            metrics={},
-            timestamp=datetime.now(),
-        )
-    ]
-
     # Create a mock GuardContext
     mock_ctx = MagicMock()
     mock_ctx.config_path = str(mock_config_file)
@@ -457,29 +454,28 @@ def test_monitor_command_success(
             mock_val_instance = MagicMock()
             mock_val_instance.capture_baseline = AsyncMock(return_value={})
             mock_val_instance.capture_current = AsyncMock(return_value={})
-            mock_val_instance.validate_upgrade = AsyncMock(return_value=mock_validation_results)
+            mock_val_instance.validate_upgrade = AsyncMock(return_value=passed_validation_results)
             mock_val_orch.return_value = mock_val_instance
 
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with patch("guard.clients.gitlab_client.GitLabClient"):
-                    with patch("guard.validation.validator_registry.ValidatorRegistry"):
-                        with patch("guard.services.istio.istio_service.IstioService"):
-                            with patch("guard.rollback.engine.RollbackEngine"):
-                                result = cli_runner.invoke(
-                                    cli,
-                                    [
-                                        "--config",
-                                        str(mock_config_file),
-                                        "monitor",
-                                        "--batch",
-                                        "test-batch",
-                                    ],
-                                )
-
-                                assert result.exit_code == 0
-                                assert "GUARD Monitor Command" in result.output
-                                assert "test-batch" in result.output
-                                assert "All validations passed" in result.output
+            with patch("guard.clients.gitlab_client.GitLabClient"):
+                with patch("guard.validation.validator_registry.ValidatorRegistry"):
+                    with patch("guard.services.istio.istio_service.IstioService"):
+                        with patch("guard.rollback.engine.RollbackEngine"):
+                            result = cli_runner.invoke(
+                                cli,
+                                [
+                                    "--config",
+                                    str(mock_config_file),
+                                    "monitor",
+                                    "--batch",
+                                    "test-batch",
+                                ],
+                            )
+
+                            assert result.exit_code == 0
+                            assert "GUARD Monitor Command" in result.output
+                            assert "test-batch" in result.output
+                            assert "All validations passed" in result.output
 
 
 # ==============================================================================
@@ -487,26 +483,6 @@ def test_monitor_command_success(
 # ==============================================================================
 
 
-def test_rollback_command_requires_batch(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test that rollback command requires --batch option."""
-    result = cli_runner.invoke(
-        cli, ["--config", str(mock_config_file), "rollback", "--reason", "test"]
-    )
-
-    assert result.exit_code != 0
-    assert "Missing option '--batch'" in result.output or "Error" in result.output
-
-
-def test_rollback_command_requires_reason(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test that rollback command requires --reason option."""
-    result = cli_runner.invoke(
-        cli, ["--config", str(mock_config_file), "rollback", "--batch", "test"]
-    )
-
-    assert result.exit_code != 0
-    assert "Missing option '--reason'" in result.output or "Error" in result.output
-
-
 def test_rollback_command_success(
     cli_runner: CliRunner,
     mock_config_file: Path,
@@ -557,83 +533,38 @@ def test_rollback_command_success(
 # ==============================================================================
 
 
-def test_list_command_all_clusters(
+@pytest.mark.parametrize(
+    ("extra_args", "registry_method", "expected"),
+    [
+        # Cluster IDs may be truncated in table display
+        ([], "list_all_clusters", ["GUARD List Command", "eks-test", "test-batch"]),
+        (["--batch", "test-batch"], "get_clusters_by_batch", ["Batch Filter: test-batch"]),
+        # JSON output should contain full cluster data
+        (["--format", "json"], "list_all_clusters", ["eks-test-us-east-1", "test-batch"]),
+    ],
+    ids=["all_clusters", "filter_by_batch", "json_format"],
+)
+def test_list_command(
     cli_runner: CliRunner,
     mock_config_file: Path,
     sample_clusters: list[ClusterConfig],
+    extra_args: list[str],
+    registry_method: str,
+    expected: list[str],
 ) -> None:
-    """Test list command without filters."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.return_value = MagicMock(aws=MagicMock(region="us-east-1"))
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
-                mock_registry_instance = MagicMock()
-                mock_registry_instance.list_all_clusters = MagicMock(return_value=sample_clusters)
-                mock_registry.return_value = mock_registry_instance
-
-                result = cli_runner.invoke(
-                    cli,
-                    ["--config", str(mock_config_file), "list"],
-                )
-
-                assert result.exit_code == 0
-                assert "GUARD List Command" in result.output
-                # Cluster IDs may be truncated in table display
-                assert "eks-test" in result.output
-                assert "test-batch" in result.output
-
-
-def test_list_command_filter_by_batch(
-    cli_runner: CliRunner,
-    mock_config_file: Path,
-    sample_clusters: list[ClusterConfig],
-) -> None:
-    """Test list command with batch filter."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.return_value = MagicMock(aws=MagicMock(region="us-east-1"))
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
-                mock_registry_instance = MagicMock()
-                mock_registry_instance.get_clusters_by_batch = MagicMock(
-                    return_value=sample_clusters
-                )
-                mock_registry.return_value = mock_registry_instance
-
-                result = cli_runner.invoke(
-                    cli,
-                    ["--config", str(mock_config_file), "list", "--batch", "test-batch"],
-                )
-
-                assert result.exit_code == 0
-                assert "Batch Filter: test-batch" in result.output
-
-
-def test_list_command_json_format(
-    cli_runner: CliRunner,
-    mock_config_file: Path,
-    sample_clusters: list[ClusterConfig],
-) -> None:
-    """Test list command with JSON output format."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.return_value = MagicMock(aws=MagicMock(region="us-east-1"))
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
-                mock_registry_instance = MagicMock()
-                mock_registry_instance.list_all_clusters = MagicMock(return_value=sample_clusters)
-                mock_registry.return_value = mock_registry_instance
+    """Test list command output for each filter and format option."""
+    with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
+        with patch("guard.registry.cluster_registry.ClusterRegistry") as mock_registry:
+            getattr(mock_registry.return_value, registry_method).return_value = sample_clusters
+
+            result = cli_runner.invoke(
+                cli,
+                ["--config", str(mock_config_file), "list", *extra_args],
+            )
 
-                result = cli_runner.invoke(
-                    cli,
-                    ["--config", str(mock_config_file), "list", "--format", "json"],
-                )
-
-                assert result.exit_code == 0
-                # JSON output should contain cluster data
-                assert "eks-test-us-east-1" in result.output
-                assert "test-batch" in result.output
+            assert result.exit_code == 0
+            for text in expected:
+                assert text in result.output
 
 
 # ==============================================================================
@@ -641,47 +572,48 @@ def test_list_command_json_format(
 # ==============================================================================
 
 
-def test_validate_command_success(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test successful validate command execution."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.return_value = MagicMock(
-            aws=MagicMock(region="us-east-1"),
-            datadog=MagicMock(api_key="test", app_key="test"),
-            gitlab=MagicMock(url="https://gitlab.com", token="test"),
-        )
-
-        with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
-            with patch("guard.adapters.datadog_adapter.DatadogAdapter"):
-                with patch("guard.adapters.gitlab_adapter.GitLabAdapter"):
-                    with patch("guard.adapters.aws_adapter.AWSAdapter"):
-                        result = cli_runner.invoke(
-                            cli,
-                            ["--config", str(mock_config_file), "validate"],
-                        )
-
-                        assert result.exit_code == 0
-                        assert "GUARD Validate Command" in result.output
-                        assert "Configuration File" in result.output
-                        assert "Config file valid" in result.output
-                        assert "DynamoDB Connectivity" in result.output
-                        assert "Datadog Connectivity" in result.output
-                        assert "GitLab Connectivity" in result.output
-                        assert "AWS Connectivity" in result.output
-                        assert "Validation complete" in result.output
-
-
-def test_validate_command_invalid_config(cli_runner: CliRunner, mock_config_file: Path) -> None:
-    """Test validate command with invalid config file."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.side_effect = ValueError("Invalid config format")
+@pytest.mark.parametrize(
+    ("load_error", "expected"),
+    [
+        (
+            None,
+            [
+                "GUARD Validate Command",
+                "Configuration File",
+                "Config file valid",
+                "DynamoDB Connectivity",
+                "Datadog Connectivity",
+                "GitLab Connectivity",
+                "AWS Connectivity",
+                "Validation complete",
+            ],
+        ),
+        (ValueError("Invalid config format"), ["Config file invalid"]),
+    ],
+    ids=["success", "invalid_config"],
+)
+def test_validate_command(
+    cli_runner: CliRunner,
+    mock_config_file: Path,
+    mock_config_from_file: MagicMock,
+    load_error: Exception | None,
+    expected: list[str],
+) -> None:
+    """Test validate command output for a loadable and an invalid config file."""
+    mock_config_from_file.side_effect = load_error
 
-        result = cli_runner.invoke(
-            cli,
-            ["--config", str(mock_config_file), "validate"],
-        )
+    with patch("guard.adapters.dynamodb_adapter.DynamoDBAdapter"):
+        with patch("guard.adapters.datadog_adapter.DatadogAdapter"):
+            with patch("guard.adapters.gitlab_adapter.GitLabAdapter"):
+                with patch("guard.adapters.aws_adapter.AWSAdapter"):
+                    result = cli_runner.invoke(
+                        cli,
+                        ["--config", str(mock_config_file), "validate"],
+                    )
 
-        assert result.exit_code == 0
-        assert "Config file invalid" in result.output
+                    assert result.exit_code == 0
+                    for text in expected:
+                        assert text in result.output
 
 
 def test_validate_command_connection_failures(
@@ -716,23 +648,26 @@ def test_validate_command_connection_failures(
 # ==============================================================================
 
 
-def test_run_command_handles_exceptions(cli_runner: CliRunner, mock_config_file: Path) -> None:
+def test_run_command_handles_exceptions(
+    cli_runner: CliRunner, mock_config_file: Path, mock_config_from_file: MagicMock
+) -> None:
     """Test that run command handles and logs exceptions."""
-    with patch("guard.core.config.GuardConfig.from_file") as mock_config:
-        mock_config.side_effect = Exception("Unexpected error")
+    mock_config_from_file.side_effect = Exception("Unexpected error")
 
-        result = cli_runner.invoke(
-            cli,
-            [
-                "--config",
-                str(mock_config_file),
-                "run",
-                "--batch",
-                "test",
-                "--target-version",
-                "1.20.0",
-            ],
-        )
+    result = cli_runner.invoke(
+        cli,
+        [
+            "--config",
+            str(mock_config_file),
+            "run",
+            "--batch",
+            "test",
+            "--target-version",
+            "1.20.0",
+        ],
+        standalone_mode=False,
+    )
 
-        # Should raise and exit with error
-        assert result.exit_code != 0
+    # Should raise and exit with error
+    assert result.exit_code != 0
+    assert str(result.exception) == "Unexpected error"
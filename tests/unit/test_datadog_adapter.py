@@ -5,19 +5,27 @@ All Datadog API calls are mocked to ensure tests are isolated and fast.
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from guard.adapters import datadog_adapter
 from guard.adapters.datadog_adapter import DatadogAdapter
 from guard.interfaces.exceptions import MetricsProviderError
 from guard.interfaces.metrics_provider import MetricPoint
 
 
+@pytest.fixture(autouse=True)
+def mock_datadog_client_class(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the DatadogClient class used by the adapter with a fresh mock per test."""
+    mock_class = MagicMock()
+    monkeypatch.setattr(datadog_adapter, "DatadogClient", mock_class)
+    return mock_class
+
+
 class TestDatadogAdapterInit:
     """Tests for DatadogAdapter initialization."""
 
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     def test_init_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test successful adapter initialization."""
         mock_client = MagicMock()
@@ -32,7 +40,6 @@ class TestDatadogAdapterInit:
         )
         assert adapter.client == mock_client
 
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     def test_init_with_custom_site(self, mock_datadog_client_class: MagicMock) -> None:
         """Test initialization with custom Datadog site."""
         mock_client = MagicMock()
@@ -44,7 +51,6 @@ class TestDatadogAdapterInit:
             api_key="test-api-key", app_key="test-app-key", site="datadoghq.eu"
         )
 
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     def test_init_failure_raises_metrics_provider_error(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -61,7 +67,6 @@ class TestDatadogAdapterQueryTimeseries:
     """Tests for query_timeseries method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_timeseries_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test successful timeseries query."""
         start_time = datetime(2024, 1, 1, 0, 0, 0)
@@ -102,7 +107,6 @@ class TestDatadogAdapterQueryTimeseries:
         assert result[0].tags["service"] == "istio-system"
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_timeseries_no_tags(self, mock_datadog_client_class: MagicMock) -> None:
         """Test timeseries query without tags."""
         start_time = datetime(2024, 1, 1, 0, 0, 0)
@@ -129,7 +133,6 @@ class TestDatadogAdapterQueryTimeseries:
         assert result[0].value == 45.3
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_timeseries_empty_result(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -150,7 +153,6 @@ class TestDatadogAdapterQueryTimeseries:
         assert result == []
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_timeseries_filters_null_values(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -186,7 +188,6 @@ class TestDatadogAdapterQueryTimeseries:
         assert result[1].value == 20.0
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_timeseries_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test timeseries query failure raises MetricsProviderError."""
         mock_client = MagicMock()
@@ -207,7 +208,6 @@ class TestDatadogAdapterQueryScalar:
     """Tests for query_scalar method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_scalar_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test successful scalar query (averages all points)."""
         start_time = datetime(2024, 1, 1, 0, 0, 0)
@@ -239,7 +239,6 @@ class TestDatadogAdapterQueryScalar:
         assert result == 20.0
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_scalar_no_data_returns_zero(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -257,7 +256,6 @@ class TestDatadogAdapterQueryScalar:
         assert result == 0.0
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_scalar_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test scalar query failure raises MetricsProviderError."""
         mock_client = MagicMock()
@@ -278,7 +276,6 @@ class TestDatadogAdapterQueryStatistics:
     """Tests for query_statistics method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_statistics_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test successful statistics query."""
         start_time = datetime(2024, 1, 1, 0, 0, 0)
@@ -322,7 +319,6 @@ class TestDatadogAdapterQueryStatistics:
         assert result["count"] == 3.0  # 3 data points
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_statistics_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test statistics query failure raises MetricsProviderError."""
         mock_client = MagicMock()
@@ -343,7 +339,6 @@ class TestDatadogAdapterCheckActiveAlerts:
     """Tests for check_active_alerts method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_check_active_alerts_no_alerts(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -361,7 +356,6 @@ class TestDatadogAdapterCheckActiveAlerts:
         mock_client.check_monitor_health.assert_called_once_with(tags=None)
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_check_active_alerts_with_alerts(
         self, mock_datadog_client_class: MagicMock
     ) -> None:
@@ -393,7 +387,6 @@ class TestDatadogAdapterCheckActiveAlerts:
         )
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_check_active_alerts_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test check alerts failure raises MetricsProviderError."""
         mock_client = MagicMock()
@@ -412,7 +405,6 @@ class TestDatadogAdapterGetMonitorStatus:
     """Tests for get_monitor_status method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_get_monitor_status_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test successful monitor status retrieval."""
         mock_client = MagicMock()
@@ -435,7 +427,6 @@ class TestDatadogAdapterGetMonitorStatus:
         assert result["overall_state"] == "OK"
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_get_monitor_status_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test monitor status retrieval failure."""
         mock_client = MagicMock()
@@ -454,7 +445,6 @@ class TestDatadogAdapterQueryRaw:
     """Tests for query_raw method."""
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_raw_success(self, mock_datadog_client_class: MagicMock) -> None:
         """Test raw query returns unprocessed results."""
         start_time = datetime(2024, 1, 1, 0, 0, 0)
@@ -483,7 +473,6 @@ class TestDatadogAdapterQueryRaw:
         )
 
     @pytest.mark.asyncio
-    @patch("guard.adapters.datadog_adapter.DatadogClient")
     async def test_query_raw_failure(self, mock_datadog_client_class: MagicMock) -> None:
         """Test raw query failure raises MetricsProviderError."""
         mock_client = MagicMock()
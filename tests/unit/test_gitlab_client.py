@@ -129,6 +129,15 @@ class TestCreateBranch:
             {"branch": "feature/test-branch", "ref": "main"}
         )
 
+    def test_create_branch_uses_lazy_project(self, gitlab_client: GitLabClient) -> None:
+        """Test create_branch does not fetch the project before creating the branch."""
+        mock_project = Mock()
+        gitlab_client.gl.projects.get = Mock(return_value=mock_project)
+
+        gitlab_client.create_branch(project_id="group/project", branch_name="test-branch")
+
+        gitlab_client.gl.projects.get.assert_called_once_with("group/project", lazy=True)
+
     def test_create_branch_default_ref(self, gitlab_client: GitLabClient) -> None:
         """Test branch creation uses 'main' as default ref."""
         mock_project = Mock()
@@ -617,6 +626,29 @@ class TestGetUserIdByUsername:
         # Verify @ was stripped
         gitlab_client.gl.users.list.assert_called_once_with(username="testuser")
 
+    def test_get_user_id_by_username_caches_found_user(self, gitlab_client: GitLabClient) -> None:
+        """Test repeated lookups, with or without @, hit the API once."""
+        mock_user = Mock()
+        mock_user.id = 789
+
+        gitlab_client.gl.users.list = Mock(return_value=[mock_user])
+
+        assert gitlab_client.get_user_id_by_username("testuser") == 789
+        assert gitlab_client.get_user_id_by_username("@testuser") == 789
+
+        gitlab_client.gl.users.list.assert_called_once_with(username="testuser")
+
+    def test_get_user_id_by_username_does_not_cache_misses(
+        self, gitlab_client: GitLabClient
+    ) -> None:
+        """Test a user that was not found is looked up again next time."""
+        gitlab_client.gl.users.list = Mock(return_value=[])
+
+        assert gitlab_client.get_user_id_by_username("newuser") is None
+        assert gitlab_client.get_user_id_by_username("newuser") is None
+
+        assert gitlab_client.gl.users.list.call_count == 2
+
     def test_get_user_id_by_username_not_found(self, gitlab_client: GitLabClient) -> None:
         """Test user lookup returns None when user not found."""
         gitlab_client.gl.users.list = Mock(return_value=[])
@@ -664,13 +696,15 @@ class TestGitLabClientRetryBehavior:
     def test_create_branch_retries_exhausted(self, gitlab_client: GitLabClient) -> None:
         """Test create_branch does not retry since exception is converted before retry decorator."""
         # Note: Same issue as get_project - exception is caught and converted before retry
-        gitlab_client.gl.projects.get = Mock(side_effect=GitlabError("Rate limit exceeded"))
+        mock_project = Mock()
+        mock_project.branches.create = Mock(side_effect=GitlabError("Rate limit exceeded"))
+        gitlab_client.gl.projects.get = Mock(return_value=mock_project)
 
         # Should raise GitOpsError without retrying
         with pytest.raises(GitOpsError) as exc_info:
             gitlab_client.create_branch(project_id="group/project", branch_name="test-branch")
 
         # Verify the error message
-        assert "Failed to get project" in str(exc_info.value)
+        assert "Failed to create branch" in str(exc_info.value)
         # Only called once (no retries because exception is converted)
-        assert gitlab_client.gl.projects.get.call_count == 1
+        assert mock_project.branches.create.call_count == 1
@@ -4,7 +4,7 @@ Tests the Istio latency validator for comparing latency before and after upgrade
 All external dependencies are mocked to ensure tests are isolated and fast.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
@@ -471,14 +471,14 @@ class TestIstioLatencyValidatorValidate:
         thresholds: ValidationThresholds,
     ) -> None:
         """Test that validation result has recent timestamp."""
-        before = datetime.utcnow()
+        before = datetime.now(UTC)
         result = await validator.validate(
             cluster=sample_cluster_config,
             baseline=baseline_snapshot,
             current=current_snapshot_healthy,
             thresholds=thresholds,
         )
-        after = datetime.utcnow()
+        after = datetime.now(UTC)
 
         assert before <= result.timestamp <= after
 
@@ -5,7 +5,7 @@ All external dependencies are mocked to ensure tests are isolated and fast.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -13,6 +13,7 @@ import pytest
 from guard.core.models import ClusterConfig, ValidationThresholds
 from guard.interfaces.metrics_provider import MetricsProvider
 from guard.interfaces.validator import MetricsSnapshot, ValidationResult, Validator
+from guard.services.istio.validators.latency import IstioLatencyValidator
 from guard.validation.validation_orchestrator import ValidationOrchestrator
 from guard.validation.validator_registry import ValidatorRegistry
 
@@ -212,6 +213,71 @@ class TestValidationOrchestratorCaptureBaseline:
         # Should query each unique metric only once
         assert mock_metrics_provider.query_scalar.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_capture_baseline_caches_required_metrics(
+        self,
+        orchestrator: ValidationOrchestrator,
+        mock_metrics_provider: MagicMock,
+        mock_validator: MagicMock,
+        registry: ValidatorRegistry,
+        sample_cluster_config: ClusterConfig,
+    ) -> None:
+        """Test that required metrics are resolved once per validator."""
+        registry.register(mock_validator)
+        mock_metrics_provider.query_scalar.return_value = 100.0
+
+        await orchestrator.capture_baseline(cluster=sample_cluster_config, duration_minutes=10)
+        snapshot = await orchestrator.capture_baseline(
+            cluster=sample_cluster_config, duration_minutes=10
+        )
+
+        mock_validator.get_required_metrics.assert_awaited_once()
+        assert set(snapshot.metrics) == {
+            "istio.request.latency.p95",
+            "istio.request.error.5xx.rate",
+        }
+
+    @pytest.mark.asyncio
+    async def test_capture_baseline_bounds_concurrent_queries(
+        self,
+        mock_metrics_provider: MagicMock,
+        registry: ValidatorRegistry,
+        sample_cluster_config: ClusterConfig,
+    ) -> None:
+        """Test that metric queries run concurrently up to max_concurrent_queries."""
+        orchestrator = ValidationOrchestrator(
+            registry=registry,
+            metrics_provider=mock_metrics_provider,
+            max_concurrent_queries=2,
+        )
+
+        validator = MagicMock(spec=Validator)
+        validator.name = "wide_validator"
+        validator.get_required_metrics = AsyncMock(
+            return_value=[f"custom.metric.{i}" for i in range(6)]
+        )
+        registry.register(validator)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_query(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1.0
+
+        mock_metrics_provider.query_scalar.side_effect = slow_query
+
+        snapshot = await orchestrator.capture_baseline(
+            cluster=sample_cluster_config, duration_minutes=10
+        )
+
+        assert peak == 2
+        assert list(snapshot.metrics) == [f"custom.metric.{i}" for i in range(6)]
+
     @pytest.mark.asyncio
     async def test_capture_baseline_uses_correct_time_range(
         self,
@@ -536,27 +602,40 @@ class TestValidationOrchestratorValidateUpgrade:
             )
         )
 
+        validator2_cancelled = False
+
+        async def slow_validate(*args, **kwargs):
+            nonlocal validator2_cancelled
+            try:
+                await asyncio.sleep(100)
+            except asyncio.CancelledError:
+                validator2_cancelled = True
+                raise
+
         validator2 = MagicMock(spec=Validator)
         validator2.name = "validator_2"
         validator2.is_critical = True
-        validator2.timeout_seconds = 60
-        validator2.validate = AsyncMock()
+        validator2.timeout_seconds = 120
+        validator2.validate = AsyncMock(side_effect=slow_validate)
 
         registry.register(validator1)
         registry.register(validator2)
 
-        results = await fail_fast_orchestrator.validate_upgrade(
-            cluster=sample_cluster_config,
-            baseline=sample_baseline_snapshot,
-            current=sample_current_snapshot,
-            thresholds=sample_thresholds,
+        results = await asyncio.wait_for(
+            fail_fast_orchestrator.validate_upgrade(
+                cluster=sample_cluster_config,
+                baseline=sample_baseline_snapshot,
+                current=sample_current_snapshot,
+                thresholds=sample_thresholds,
+            ),
+            timeout=5,
         )
 
         # Should only have one result (stopped after first failure)
         assert len(results) == 1
         assert results[0].passed is False
-        # Validator2 should never be called
-        validator2.validate.assert_not_called()
+        # Validator2 should be cancelled rather than waited on
+        assert validator2_cancelled is True
 
     @pytest.mark.asyncio
     async def test_validate_upgrade_fail_fast_continues_on_non_critical_failure(
@@ -614,6 +693,96 @@ class TestValidationOrchestratorValidateUpgrade:
         assert len(results) == 2
         validator2.validate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_validate_upgrade_runs_validators_concurrently(
+        self,
+        orchestrator: ValidationOrchestrator,
+        registry: ValidatorRegistry,
+        sample_cluster_config: ClusterConfig,
+        sample_baseline_snapshot: MetricsSnapshot,
+        sample_current_snapshot: MetricsSnapshot,
+        sample_thresholds: ValidationThresholds,
+    ) -> None:
+        """Test that validators run concurrently when fail-fast is disabled."""
+        # validator_1 can only finish once validator_2 has started
+        validator2_started = asyncio.Event()
+
+        def make_result(name: str) -> ValidationResult:
+            return ValidationResult(
+                cluster_id=sample_cluster_config.cluster_id,
+                validator_name=name,
+                passed=True,
+                violations=[],
+                metrics={},
+                timestamp=datetime.utcnow(),
+            )
+
+        async def wait_for_validator2(*args, **kwargs):
+            await validator2_started.wait()
+            return make_result("validator_1")
+
+        async def start_validator2(*args, **kwargs):
+            validator2_started.set()
+            return make_result("validator_2")
+
+        validator1 = MagicMock(spec=Validator)
+        validator1.name = "validator_1"
+        validator1.is_critical = True
+        validator1.timeout_seconds = 1
+        validator1.validate = AsyncMock(side_effect=wait_for_validator2)
+
+        validator2 = MagicMock(spec=Validator)
+        validator2.name = "validator_2"
+        validator2.is_critical = True
+        validator2.timeout_seconds = 1
+        validator2.validate = AsyncMock(side_effect=start_validator2)
+
+        registry.register(validator1)
+        registry.register(validator2)
+
+        results = await orchestrator.validate_upgrade(
+            cluster=sample_cluster_config,
+            baseline=sample_baseline_snapshot,
+            current=sample_current_snapshot,
+            thresholds=sample_thresholds,
+        )
+
+        # Results keep registration order and nobody timed out
+        assert [r.validator_name for r in results] == ["validator_1", "validator_2"]
+        assert all(r.passed for r in results)
+
+    @pytest.mark.asyncio
+    async def test_validate_upgrade_timestamps_are_comparable(
+        self,
+        orchestrator: ValidationOrchestrator,
+        mock_validator: MagicMock,
+        registry: ValidatorRegistry,
+        sample_cluster_config: ClusterConfig,
+        sample_baseline_snapshot: MetricsSnapshot,
+        sample_current_snapshot: MetricsSnapshot,
+        sample_thresholds: ValidationThresholds,
+    ) -> None:
+        """Test real validator timestamps line up with orchestrator-built results."""
+        registry.register(IstioLatencyValidator())
+        registry.register(mock_validator)
+
+        # The orchestrator stamps failed results with its own start time
+        mock_validator.validate.side_effect = Exception("boom")
+
+        before = datetime.now(UTC)
+        results = await orchestrator.validate_upgrade(
+            cluster=sample_cluster_config,
+            baseline=sample_baseline_snapshot,
+            current=sample_current_snapshot,
+            thresholds=sample_thresholds,
+        )
+        after = datetime.now(UTC)
+
+        assert [r.validator_name for r in results] == ["istio_latency", "test_validator"]
+        for result in results:
+            assert result.timestamp.tzinfo is not None
+            assert before <= result.timestamp <= after
+
 
 class TestValidationOrchestratorRunSpecificValidators:
     """Tests for running specific validators."""